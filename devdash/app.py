@@ -7,6 +7,8 @@ from textual.binding import Binding
 from textual.command import Hit, Hits, Provider
 from textual.containers import Horizontal, Vertical
 from textual.reactive import reactive
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import (
     DataTable,
     Footer,
@@ -16,6 +18,8 @@ from textual.widgets import (
     TabbedContent,
     TabPane,
 )
+from textual.widgets.data_table import ColumnKey
+from textual.worker import get_current_worker
 
 from devdash.config import Config
 from devdash.screens import (
@@ -53,51 +57,225 @@ from devdash.processes import (
     kill_process,
     stop_docker_container,
 )
+from devdash.updater import UpdateResult
 
 import dataclasses
+import functools
 import json
-import re
+import math
+import os
 import shlex
 import shutil
+import subprocess
 import threading
 import time
 from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: pip install devdash[fast]
+    orjson = None
+
 _color_low = 50.0
 _color_high = 80.0
 
+# Claude collectors scan ~/.claude on disk; run them every Nth refresh.
+_CLAUDE_REFRESH_EVERY = 3
+
+# The full process list is shown on the System tab only, but snapshots export
+# it too; off that tab it is still sampled every Nth refresh so the export has
+# real CPU readings from the one sampling path.
+_ALL_PROCS_REFRESH_EVERY = 3
+
+# Most collectors a single refresh can submit (node, docker, stats plus the four
+# Claude ones on the Claude tab), so none waits behind a slow `docker ps`.
+_COLLECTOR_WORKERS = 7
+
+_probe_lock = threading.Lock()
+_probe_cache: dict[str, object] = {}
+
+
+def _json_default(obj: object) -> object:
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        # Shallow field mapping instead of asdict's recursive deep copy (slotted
+        # dataclasses have no __dict__); json calls back here for nested ones.
+        return {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj)}
+    return str(obj)
+
 
 def _shell_quote(path: str) -> str:
     return shlex.quote(path)
 
 
+# Fixed AppleScript source that takes the shell command as argv, so osascript
+# never has to parse (or escape) the command text itself.
+_TERMINAL_DO_SCRIPT = (
+    "-e", "on run argv",
+    "-e", 'tell application "Terminal" to do script (item 1 of argv)',
+    "-e", "end run",
+)
+
+
+def _spawn_detached(name: str, *args: str) -> subprocess.Popen:
+    """Start a helper program in its own session with stdio detached from the TUI.
+
+    The executable is resolved on PATH once per process. Python fds are
+    non-inheritable by default, so close_fds=False only skips the close loop.
+    """
+    exe = _probe(f"bin:{name}", lambda: shutil.which(name) or name)
+    return subprocess.Popen(
+        [exe, *args],
+        close_fds=False,
+        start_new_session=True,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _terminal_do_script(script: str) -> subprocess.Popen:
+    return _spawn_detached("osascript", *_TERMINAL_DO_SCRIPT, script)
+
+
+def _probe(key: str, compute: Callable[[], object]) -> object:
+    """Compute an environment probe once per process."""
+    with _probe_lock:
+        if key not in _probe_cache:
+            _probe_cache[key] = compute()
+        return _probe_cache[key]
+
+
+def _rebuild_style_table() -> None:
+    """Precompute the severity style for every 0.1% step (call when thresholds change)."""
+    global _style_table
+    lo = min(max(math.ceil(_color_low * 10), 0), 1001)
+    hi = min(max(math.ceil(_color_high * 10), lo), 1001)
+    _style_table = ["green"] * lo + ["yellow"] * (hi - lo) + ["red"] * (1001 - hi)
+
+
+_style_table: list[str] = []
+_rebuild_style_table()
+
+
 def _severity_style(percent: float) -> str:
-    if percent < _color_low:
-        return "green"
-    if percent < _color_high:
-        return "yellow"
-    return "red"
+    i = int(percent * 10)
+    if i < 0:
+        i = 0
+    elif i > 1000:
+        i = 1000
+    return _style_table[i]
+
+
+@functools.lru_cache(maxsize=2048)
+def _styled_text(text: str, style: str) -> Text:
+    """Shared Text for a (text, style) pair; cells treat these as read-only."""
+    return Text(text, style=style)
 
 
 def _colored_percent(value: float, suffix: str = "%") -> Text:
-    style = _severity_style(value)
-    return Text(f"{value:.1f}{suffix}", style=style)
+    return _styled_text(f"{value:.1f}{suffix}", _severity_style(value))
 
 
 def _colored_memory(mb: float) -> Text:
     percent = min(mb / 1024 * 100, 100)
-    style = _severity_style(percent)
-    return Text(f"{mb:.0f} MB", style=style)
+    return _styled_text(f"{mb:.0f} MB", _severity_style(percent))
+
+
+_SPARK_BLOCKS = (" ", "\u2581", "\u2582", "\u2583", "\u2584", "\u2585", "\u2586", "\u2587", "\u2588")
+
+
+@functools.lru_cache(maxsize=64)
+def _spark_blocks(values: tuple[int, ...]) -> str:
+    """Block-character bar scaled to the max value; the stats inputs rarely change between refreshes."""
+    max_val = max(values, default=0)
+    if max_val <= 0:
+        return _SPARK_BLOCKS[0] * len(values)
+    blocks = _SPARK_BLOCKS
+    return "".join([blocks[min(v * 7 // max_val + (v > 0), 8)] for v in values])
+
 
+def _bar_str(percent: float, width: int = 30) -> str:
+    # Only tenths are displayed, so key the cache on them rather than raw floats.
+    return _bar_tenths(round(percent * 10), width)
 
-def _colored_bar(percent: float, width: int = 30) -> Text:
+
+@functools.lru_cache(maxsize=2048)
+def _bar_tenths(tenths: int, width: int) -> str:
+    percent = tenths / 10
     filled = int(percent / 100 * width)
     empty = width - filled
-    style = _severity_style(percent)
-    bar_str = f"[{'|' * filled}{' ' * empty}] {percent:.1f}%"
-    return Text(bar_str, style=style)
+    return f"[{'|' * filled}{' ' * empty}] {percent:.1f}%"
+
+
+def _node_row(proc: NodeProcess) -> list:
+    """Display cells for a node-table row; built on the loader thread."""
+    return [
+        str(proc.pid),
+        proc.project or "-",
+        proc.ports_label,
+        _colored_memory(proc.memory_mb),
+        _colored_percent(proc.cpu_percent),
+        proc.uptime,
+        proc.cwd,
+        proc.command,
+    ]
+
+
+def _docker_row(container: DockerContainer) -> list:
+    return [
+        container.container_id,
+        container.name,
+        container.image,
+        container.status,
+        container.ports or "-",
+        container.created,
+        container.compose_project or "-",
+        container.compose_service or "-",
+    ]
+
+
+def _proc_row(proc: GeneralProcess) -> list:
+    return [
+        str(proc.pid),
+        proc.name,
+        _colored_percent(proc.cpu_percent),
+        _colored_memory(proc.memory_mb),
+        _colored_percent(proc.memory_percent),
+        proc.user,
+        proc.status,
+        proc.command,
+    ]
+
+
+def _claude_row(inst: ClaudeInstance) -> list:
+    return [
+        str(inst.pid),
+        inst.project or "-",
+        inst.tty,
+        _colored_memory(inst.memory_mb),
+        _colored_percent(inst.cpu_percent),
+        inst.uptime,
+        inst.cwd,
+    ]
+
+
+def _plain_cells(cells: list) -> tuple[str, ...]:
+    """Plain text of a row's cells, as compared when diffing table contents."""
+    return tuple(c.plain if type(c) is Text else c if type(c) is str else str(c) for c in cells)
+
+
+def _search_blob(plain: tuple[str, ...]) -> str:
+    """Casefolded text of a row's cells for filter matching; fields split by \\x1f."""
+    return "\x1f".join(plain).casefold()
+
+
+def _after(future: Future, fn: Callable[[], object]) -> object:
+    """Wait for future to settle (without raising), then call fn."""
+    future.exception()
+    return fn()
 
 
 class StatusBar(Static):
@@ -303,36 +481,85 @@ class DevDashApp(App):
     claude_projects: list[ClaudeProject] = []
     claude_stats: ClaudeStats | None = None
     claude_recent_sessions: list[ClaudeSessionEntry] = []
+    _node_by_pid: dict[int, NodeProcess] = {}
+    _docker_by_id: dict[str, DockerContainer] = {}
+    _all_by_pid: dict[int, GeneralProcess] = {}
+    _claude_by_pid: dict[int, ClaudeInstance] = {}
+    _sessions_by_id: dict[str, ClaudeSessionEntry] = {}
     _current_tab: str = "dev"
     _active_table_id: str = "node-table"
-    _sort_state: dict[str, tuple[int, bool]] = {}  # table_id -> (col_index, reverse)
+    _sort_state: dict[str, tuple[int, bool]]  # table_id -> (col_index, reverse)
     _filter_text: str = ""
+    _filter_lower: str = ""
+    _filter_timer: Timer | None = None
+    _refresh_timer: Timer | None = None
+    _sys_stats_parts: tuple = ()  # last (text, style) pieces shown in the stats panel
+    _status_key: tuple = ()  # displayed (rounded) values behind _status_text
+    _status_text: str = ""
+    _highlighted_header: Widget | None = None
+    _row_marked: dict[str, set[str]]  # table_id -> row keys currently showing the "* " marker
+    _last_render: dict[str, tuple]  # _update_* name -> inputs of the last render
+    _row_search: dict[str, dict[str, str]]  # table_id -> row_key -> casefolded cell text, from the loader
     _prev_node_pids: set[int] = set()
-    _prev_node_ports: dict[int, list[int]] = {}
+    _prev_node_ports: dict[int, tuple[int, ...]] = {}
     _prev_docker_ids: set[str] = set()
     _tracking_initialized: bool = False
-    _selected_pids: set[int] = set()
-    _selected_containers: set[str] = set()
-    _idle_tracker: dict[int, float] = {}  # pid -> monotonic timestamp when CPU first dropped below threshold
+    # Row keys as stored in the tables (str); cast to int only when killing.
+    _selected_pids: set[str]
+    _selected_containers: set[str]
+    _idle_tracker: dict[int, float]  # pid -> monotonic timestamp when CPU first dropped below threshold
+    _col_keys: dict[str, list[ColumnKey]]  # table_id -> column keys in display order
+    _row_snapshot: dict[str, dict[str, tuple[str, ...]]]  # table_id -> row_key -> last written plain cells
+    _row_keys: dict[str, list[str]]  # table_id -> row keys in sync order
+    _columns: dict[str, list[list]]  # table_id -> column index -> cells aligned with _row_keys
+    _rows: dict[str, dict[str, list]] = {}  # table id -> row key -> prebuilt cells from the loader
+    _row_plain: dict[str, dict[str, tuple[str, ...]]] = {}  # table id -> row key -> plain text of those cells
+    _w: dict[str, Widget] = {}  # widget id -> widget, cached in on_mount
 
     def __init__(
         self,
         config: Config | None = None,
-        update_check_event: threading.Event | None = None,
-        get_update_message: Callable[[], str | None] | None = None,
+        update: UpdateResult | None = None,
     ) -> None:
         super().__init__()
         self._config = config or Config()
-        self._update_check_event = update_check_event
-        self._get_update_message = get_update_message
-        self._has_claude = (
-            shutil.which("claude") is not None
-            or (Path.home() / ".claude").is_dir()
+        self._update = update
+        # Per-instance state mutated in place; class-level defaults would be
+        # shared by every app created in the process.
+        self._sort_state = {}
+        self._row_marked = {}
+        self._last_render = {}
+        self._row_search = {}
+        self._selected_pids = set()
+        self._selected_containers = set()
+        self._idle_tracker = {}
+        self._col_keys = {}
+        self._row_snapshot = {}
+        self._row_keys = {}
+        self._columns = {}
+        self._refresh_event = threading.Event()
+        # Cleared while a confirm prompt is open; the loader waits on it.
+        self._refresh_unpaused = threading.Event()
+        self._refresh_unpaused.set()
+        self._status_lock = threading.Lock()
+        self._status_pending: str | None = None
+        self._collector_pool = ThreadPoolExecutor(max_workers=_COLLECTOR_WORKERS, thread_name_prefix="devdash-collect")
+        # One reusable thread for confirmed kill/stop actions, run in order.
+        self._action_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="devdash-action")
+        self._watched_ports = frozenset(self._config.watched_ports)
+        self._has_claude = _probe(
+            "has_claude",
+            lambda: shutil.which("claude") is not None or (Path.home() / ".claude").is_dir(),
         )
-        self._editor_cmd = shutil.which("code") or shutil.which("cursor")
+        self._editor_cmd = _probe(
+            "editor_cmd",
+            lambda: shutil.which("code") or shutil.which("cursor"),
+        )
+        self._tabs_hint = "1/2/3=tabs q=quit" if self._has_claude else "1/2=tabs q=quit"
         global _color_low, _color_high
         _color_low = self._config.color_threshold_low
         _color_high = self._config.color_threshold_high
+        _rebuild_style_table()
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -364,51 +591,70 @@ class DevDashApp(App):
         yield Footer()
 
     def on_mount(self) -> None:
-        node_table = self.query_one("#node-table", DataTable)
+        self.install_screen(ConfirmScreen(), name="confirm")
+        widget_ids = [
+            "tabs", "filter-bar", "filter-input", "status-bar", "sys-stats",
+            "node-table", "docker-table", "all-procs-table",
+            "node-header", "docker-header", "procs-header",
+        ]
+        if self._has_claude:
+            widget_ids += [
+                "claude-stats-bar",
+                "claude-instances-table", "claude-projects-table", "claude-sessions-table",
+                "claude-instances-header", "claude-projects-header", "claude-sessions-header",
+            ]
+        self._w = {widget_id: self.query_one(f"#{widget_id}") for widget_id in widget_ids}
+
+        node_table = self._w["node-table"]
         node_table.cursor_type = "row"
-        node_table.add_columns("PID", "Project", "Port(s)", "Memory", "CPU", "Uptime", "Directory", "Command")
+        self._col_keys["node-table"] = node_table.add_columns("PID", "Project", "Port(s)", "Memory", "CPU", "Uptime", "Directory", "Command")
 
-        docker_table = self.query_one("#docker-table", DataTable)
+        docker_table = self._w["docker-table"]
         docker_table.cursor_type = "row"
-        docker_table.add_columns("ID", "Name", "Image", "Status", "Ports", "Running For", "Compose", "Service")
+        self._col_keys["docker-table"] = docker_table.add_columns("ID", "Name", "Image", "Status", "Ports", "Running For", "Compose", "Service")
 
-        all_table = self.query_one("#all-procs-table", DataTable)
+        all_table = self._w["all-procs-table"]
         all_table.cursor_type = "row"
-        all_table.add_columns("PID", "Name", "CPU %", "Memory", "Mem %", "User", "Status", "Command")
+        self._col_keys["all-procs-table"] = all_table.add_columns("PID", "Name", "CPU %", "Memory", "Mem %", "User", "Status", "Command")
 
         if self._has_claude:
-            claude_inst_table = self.query_one("#claude-instances-table", DataTable)
+            claude_inst_table = self._w["claude-instances-table"]
             claude_inst_table.cursor_type = "row"
-            claude_inst_table.add_columns("PID", "Project", "TTY", "Memory", "CPU", "Uptime", "Directory")
+            self._col_keys["claude-instances-table"] = claude_inst_table.add_columns("PID", "Project", "TTY", "Memory", "CPU", "Uptime", "Directory")
 
-            claude_proj_table = self.query_one("#claude-projects-table", DataTable)
+            claude_proj_table = self._w["claude-projects-table"]
             claude_proj_table.cursor_type = "row"
-            claude_proj_table.add_columns("Project", "Sessions", "Messages", "Last Active", "Status", "Path")
+            self._col_keys["claude-projects-table"] = claude_proj_table.add_columns("Project", "Sessions", "Messages", "Last Active", "Status", "Path")
 
-            claude_sess_table = self.query_one("#claude-sessions-table", DataTable)
+            claude_sess_table = self._w["claude-sessions-table"]
             claude_sess_table.cursor_type = "row"
-            claude_sess_table.add_columns("Project", "Summary", "Msgs", "Branch", "Created", "Modified")
+            self._col_keys["claude-sessions-table"] = claude_sess_table.add_columns("Project", "Summary", "Msgs", "Branch", "Created", "Modified")
             self._sort_state["claude-sessions-table"] = (5, True)  # Modified desc
 
         self._highlight_active_table()
-        self.load_data()
-        self.set_interval(self._config.refresh_rate, self.load_data)
+        self._refresh_loop()
 
-        if self._update_check_event is not None:
+        if self._update is not None:
             self.set_timer(2, self._schedule_update_check)
 
+    def on_unmount(self) -> None:
+        self._w = {}
+        self._refresh_event.set()
+        self._refresh_unpaused.set()
+        self._collector_pool.shutdown(wait=False, cancel_futures=True)
+        self._action_pool.shutdown(wait=False)
+
     def _schedule_update_check(self) -> None:
         self._show_update_notification()
 
     @work(thread=True)
     def _show_update_notification(self) -> None:
-        if self._update_check_event is None:
+        if self._update is None:
             return
-        self._update_check_event.wait(timeout=8)
-        if self._get_update_message is not None:
-            msg = self._get_update_message()
-            if msg:
-                self.call_from_thread(self.notify, msg, severity="information", timeout=8)
+        self._update.done.wait(timeout=8)
+        msg = self._update.message
+        if msg:
+            self.call_from_thread(self.notify, msg, severity="information", timeout=8)
 
     _TABLE_IDS = {
         "node-table", "docker-table", "all-procs-table",
@@ -422,65 +668,67 @@ class DevDashApp(App):
             return focused.id
         return self._active_table_id
 
+    _TABLE_HEADERS = {
+        "node-table": "node-header",
+        "docker-table": "docker-header",
+        "all-procs-table": "procs-header",
+        "claude-instances-table": "claude-instances-header",
+        "claude-projects-table": "claude-projects-header",
+        "claude-sessions-table": "claude-sessions-header",
+    }
+
     def _highlight_active_table(self) -> None:
-        table_header_map = {
-            "node-table": "node-header",
-            "docker-table": "docker-header",
-            "all-procs-table": "procs-header",
-            "claude-instances-table": "claude-instances-header",
-            "claude-projects-table": "claude-projects-header",
-            "claude-sessions-table": "claude-sessions-header",
-        }
-        for table_id, header_id in table_header_map.items():
-            try:
-                header = self.query_one(f"#{header_id}", Static)
-                if table_id == self._active_table_id:
-                    header.add_class("active")
-                    header.styles.background = "dodgerblue"
-                else:
+        active = self._w.get(self._TABLE_HEADERS.get(self._active_table_id, ""))
+        if self._highlighted_header is None:
+            # First call: compose marks several headers active, reset them all.
+            for header_id in self._TABLE_HEADERS.values():
+                header = self._w.get(header_id)
+                if header is not None and header is not active:
                     header.remove_class("active")
                     header.styles.background = "grey"
-            except Exception:
-                pass
-
-        try:
-            self.query_one(f"#{self._active_table_id}", DataTable).focus()
-        except Exception:
-            pass
+        elif self._highlighted_header is not active:
+            self._highlighted_header.remove_class("active")
+            self._highlighted_header.styles.background = "grey"
+        if active is not None and active is not self._highlighted_header:
+            active.add_class("active")
+            active.styles.background = "dodgerblue"
+        self._highlighted_header = active
+
+        table = self._w.get(self._active_table_id)
+        if table is not None and not table.has_focus:
+            table.focus()
 
     def action_tab_dev(self) -> None:
-        tabs = self.query_one("#tabs", TabbedContent)
-        tabs.active = "dev"
-        self._current_tab = "dev"
-        self._active_table_id = "node-table"
-        self._highlight_active_table()
+        self._switch_tab("dev")
 
     def action_tab_system(self) -> None:
-        tabs = self.query_one("#tabs", TabbedContent)
-        tabs.active = "system"
-        self._current_tab = "system"
-        self._active_table_id = "all-procs-table"
-        self._highlight_active_table()
+        self._switch_tab("system")
 
     def action_tab_claude(self) -> None:
         if not self._has_claude:
             return
-        tabs = self.query_one("#tabs", TabbedContent)
-        tabs.active = "claude"
-        self._current_tab = "claude"
-        self._active_table_id = "claude-instances-table"
-        self._highlight_active_table()
+        self._switch_tab("claude")
+
+    _TAB_FIRST_TABLE = {"dev": "node-table", "system": "all-procs-table", "claude": "claude-instances-table"}
+
+    def _switch_tab(self, tab_id: str) -> None:
+        tabs = self._w["tabs"]
+        if tabs.active != tab_id:
+            # TabActivated follows and does the highlight/render once.
+            tabs.active = tab_id
+        else:
+            self._active_table_id = self._TAB_FIRST_TABLE[tab_id]
+            self._highlight_active_table()
 
     def on_tabbed_content_tab_activated(self, event: TabbedContent.TabActivated) -> None:
         tab_id = event.pane.id or ""
         self._current_tab = tab_id
-        if tab_id == "dev":
-            self._active_table_id = "node-table"
-        elif tab_id == "claude":
-            self._active_table_id = "claude-instances-table"
-        else:
-            self._active_table_id = "all-procs-table"
+        self._active_table_id = self._TAB_FIRST_TABLE.get(tab_id, "all-procs-table")
         self._highlight_active_table()
+        with self.batch_update():
+            self._render_tab(tab_id)
+            self._refresh_selection_display()
+        self.load_data()
 
     def action_focus_next_table(self) -> None:
         if self._current_tab == "dev":
@@ -498,14 +746,15 @@ class DevDashApp(App):
         self._highlight_active_table()
 
     def action_toggle_filter(self) -> None:
-        bar = self.query_one("#filter-bar", Horizontal)
-        inp = self.query_one("#filter-input", Input)
+        bar = self._w["filter-bar"]
+        inp = self._w["filter-input"]
         if bar.has_class("visible"):
             bar.remove_class("visible")
             self._filter_text = ""
+            self._filter_lower = ""
             inp.value = ""
             try:
-                self.query_one(f"#{self._active_table_id}", DataTable).focus()
+                self._w[self._active_table_id].focus()
             except Exception:
                 pass
             self.load_data()
@@ -516,48 +765,91 @@ class DevDashApp(App):
     def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "filter-input":
             self._filter_text = event.value
-            self._apply_filter_to_all_tables()
+            self._filter_lower = event.value.casefold()
+            if self._filter_timer is not None:
+                self._filter_timer.stop()
+            self._filter_timer = self.set_timer(0.08, self._apply_filter_to_all_tables)
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "filter-input":
             try:
-                self.query_one(f"#{self._active_table_id}", DataTable).focus()
+                self._w[self._active_table_id].focus()
             except Exception:
                 pass
 
     def key_escape(self) -> None:
-        bar = self.query_one("#filter-bar", Horizontal)
+        bar = self._w["filter-bar"]
         if bar.has_class("visible"):
             self.action_toggle_filter()
 
-    def _row_matches_filter(self, cells: list) -> bool:
-        if not self._filter_text:
+    def _row_matches_filter(self, table_id: str, key: str, cells: list) -> bool:
+        if not self._filter_lower:
             return True
-        query = self._filter_text.lower()
-        for cell in cells:
-            text = cell.plain if isinstance(cell, Text) else str(cell)
-            if query in text.lower():
-                return True
-        return False
+        search = self._row_search.setdefault(table_id, {})
+        blob = search.get(key)
+        if blob is None:
+            blob = _search_blob(_plain_cells(cells))
+            search[key] = blob
+        return self._filter_lower in blob
 
     def _apply_filter_to_all_tables(self) -> None:
-        if self.node_procs:
+        with self.batch_update():
+            self._render_tab(self._current_tab)
+            self._refresh_selection_display()
+
+    def _render_tab(self, tab: str) -> None:
+        """Paint one tab's widgets from the cached data.
+
+        Hidden panes are skipped on refresh and caught up here on activation;
+        the per-section render signatures make repeat calls cheap.
+        """
+        if not self._w:
+            return
+        if tab == "dev":
             self._update_dev_tables(self.node_procs, self.docker_containers)
-        if self.all_procs and self.system_stats:
+        elif tab == "system":
             self._update_system_tab(self.all_procs, self.system_stats)
-        if self._has_claude:
-            self._update_claude_tab(self.claude_instances, self.claude_projects)
+        elif tab == "claude" and self._has_claude:
+            self._update_claude_tab(self.claude_instances, self.claude_projects, self.claude_recent_sessions)
+            self._update_claude_stats_bar(self.claude_stats)
+
+    # Sort kind per column, aligned with the add_columns() calls in on_mount.
+    _COLUMN_KINDS: dict[str, tuple[str, ...]] = {
+        "node-table": ("int", "str", "num", "num", "num", "str", "str", "str"),
+        "docker-table": ("str", "str", "str", "str", "str", "str", "str", "str"),
+        "all-procs-table": ("int", "str", "num", "num", "num", "str", "str", "str"),
+        "claude-instances-table": ("int", "str", "str", "num", "num", "str", "str"),
+        "claude-projects-table": ("str", "num", "num", "str", "str", "str"),
+        "claude-sessions-table": ("str", "str", "num", "str", "str", "str"),
+    }
 
     @staticmethod
-    def _parse_sort_value(cell: object) -> object:
-        text = cell.plain if isinstance(cell, Text) else str(cell)
-        text = text.strip().rstrip("%")
-        match = re.match(r"^([\d.]+)", text)
-        if match:
+    def _sort_num(cell: object) -> float:
+        """Leading number of a cell ("512 MB", "3.2%"); -1 when there is none."""
+        text = cell.plain if type(cell) is Text else cell if type(cell) is str else str(cell)
+        end = 0
+        n = len(text)
+        while end < n and (text[end].isdigit() or text[end] == "."):
+            end += 1
+        if end:
             try:
-                return float(match.group(1))
+                return float(text[:end])
             except ValueError:
                 pass
+        return -1.0
+
+    @staticmethod
+    def _sort_int(cell: object) -> float:
+        if type(cell) is str:
+            try:
+                return int(cell)
+            except ValueError:
+                pass
+        return DevDashApp._sort_num(cell)
+
+    @staticmethod
+    def _sort_str(cell: object) -> str:
+        text = cell.plain if type(cell) is Text else cell if type(cell) is str else str(cell)
         return text.lower()
 
     def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
@@ -573,58 +865,221 @@ class DevDashApp(App):
         self._sort_table(table, col_index, reverse)
 
     def _sort_table(self, table: DataTable, col_index: int, reverse: bool) -> None:
-        rows = []
-        for row_key in table.rows:
-            cells = [table.get_cell(row_key, col) for col in table.columns]
-            rows.append((row_key, cells))
-        rows.sort(key=lambda r: self._parse_sort_value(r[1][col_index]), reverse=reverse)
+        table_id = table.id or ""
+        row_keys = self._row_keys.get(table_id)
+        columns = self._columns.get(table_id)
+        if row_keys is not None and columns and len(row_keys) == table.row_count:
+            column = columns[col_index]
+        else:
+            row_keys = [row_key.value for row_key in table.rows]
+            col_key = self._col_keys[table_id][col_index]
+            column = [table.get_cell(key, col_key) for key in row_keys]
+        kinds = self._COLUMN_KINDS.get(table_id, ())
+        kind = kinds[col_index] if col_index < len(kinds) else "str"
+        parse = self._sort_int if kind == "int" else self._sort_num if kind == "num" else self._sort_str
+        sort_keys = list(map(parse, column))
+        order = sorted(range(len(row_keys)), key=sort_keys.__getitem__, reverse=reverse)
+        self._reorder_rows(table, [row_keys[i] for i in order])
+
+    @classmethod
+    def _reorder_rows(cls, table: DataTable, ordered_keys: list[str]) -> None:
+        """Put rows in ordered_keys order, keeping the cursor on its row.
+
+        DataTable.sort hands its key function cell values only, so rows are
+        ranked by the text of the first column when that text is unique per
+        row. Otherwise the rows from the first misplaced one on are removed
+        and re-added in order.
+        """
+        current = [row.key.value for row in table.ordered_rows]
+        if current == ordered_keys:
+            return
         cursor_key = None
         try:
             cursor_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
         except Exception:
             pass
-        table.clear()
-        for row_key, cells in rows:
-            table.add_row(*cells, key=row_key.value)
-        if cursor_key:
+        first_col = next(iter(table.columns), None)
+        rank: dict[str, int] = {}
+        if first_col is not None:
+            cell_plain = cls._cell_plain
+            rank = {cell_plain(table.get_cell(key, first_col)): i for i, key in enumerate(ordered_keys)}
+        if len(rank) == len(ordered_keys) == table.row_count:
+            table.sort(first_col, key=lambda cell: rank[cell_plain(cell)])
+        else:
+            start = next(
+                (i for i, (have, want) in enumerate(zip(current, ordered_keys)) if have != want),
+                min(len(current), len(ordered_keys)),
+            )
+            moved = [(key, table.get_row(key)) for key in ordered_keys[start:]]
+            for key, _ in moved:
+                table.remove_row(key)
+            for key, cells in moved:
+                table.add_row(*cells, key=key)
+        if cursor_key is not None:
             try:
-                row_idx = next(i for i, (rk, _) in enumerate(rows) if rk.value == cursor_key.value)
-                table.move_cursor(row=row_idx)
-            except (StopIteration, Exception):
+                table.move_cursor(row=table.get_row_index(cursor_key))
+            except Exception:
                 pass
 
     def _apply_sort(self, table_id: str) -> None:
         sort = self._sort_state.get(table_id)
         if sort:
             try:
-                table = self.query_one(f"#{table_id}", DataTable)
+                table = self._w[table_id]
                 self._sort_table(table, sort[0], sort[1])
             except Exception:
                 pass
 
-    @work(thread=True, exclusive=True, group="loader")
+    @staticmethod
+    def _cell_plain(cell: object) -> str:
+        if type(cell) is Text:
+            return cell.plain
+        return cell if type(cell) is str else str(cell)
+
+    def _sync_table(self, table: DataTable, rows: dict[str, list]) -> None:
+        """Reconcile table contents with rows by key instead of clear+rebuild.
+
+        Vanished keys are removed, new keys appended and only cells whose plain
+        text changed are rewritten. When no user sort is active the rows are then
+        reordered in place to match the collector order. The cursor follows its
+        row key, falling back to the nearest row when that row vanished.
+        """
+        table_id = table.id or ""
+        cursor_key = None
+        if table.row_count:
+            try:
+                cursor_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
+            except Exception:
+                pass
+        snapshot = self._row_snapshot.get(table_id, {})
+        plain = self._row_plain.get(table_id, {})
+        new_snapshot = {key: plain.get(key) or _plain_cells(cells) for key, cells in rows.items()}
+        row_keys = list(rows)
+        if new_snapshot == snapshot and row_keys == self._row_keys.get(table_id):
+            # Same rows, same text, same order: nothing to write.
+            return
+        self._row_snapshot[table_id] = new_snapshot
+        self._row_keys[table_id] = row_keys
+        self._columns[table_id] = [list(column) for column in zip(*rows.values())]
+
+        for key in snapshot.keys() - rows.keys():
+            table.remove_row(key)
+
+        col_keys = self._col_keys[table_id]
+        for key, cells in rows.items():
+            old = snapshot.get(key)
+            if old is None:
+                table.add_row(*cells, key=key)
+                continue
+            new = new_snapshot[key]
+            if old == new:
+                continue
+            for col_key, cell, old_plain, new_plain in zip(col_keys, cells, old, new):
+                if old_plain != new_plain:
+                    table.update_cell(key, col_key, cell, update_width=True)
+
+        if table_id not in self._sort_state:
+            self._reorder_rows(table, row_keys)
+
+        if cursor_key is not None and cursor_key in table.rows:
+            table.move_cursor(row=table.get_row_index(cursor_key))
+        elif table.row_count and table.cursor_row >= table.row_count:
+            table.move_cursor(row=table.row_count - 1)
+
     def load_data(self) -> None:
-        node_procs = get_node_processes()
-        docker_containers = get_docker_containers()
-        all_procs = get_all_processes(limit=self._config.process_limit)
-        stats = get_system_stats()
-        claude_instances = None
-        claude_projects = None
-        claude_stats = None
-        claude_sessions = None
-        if self._has_claude:
-            claude_instances = get_claude_instances()
-            claude_projects = get_claude_projects()
-            claude_stats = get_claude_stats()
-            claude_sessions = get_all_recent_sessions()
-        self.call_from_thread(self._update_all, node_procs, docker_containers, all_procs, stats, claude_instances, claude_projects, claude_stats, claude_sessions)
+        """Wake the refresh loop for an immediate, full refresh."""
+        self._refresh_event.set()
+
+    @work(thread=True, exclusive=True, group="loader")
+    def _refresh_loop(self) -> None:
+        worker = get_current_worker()
+        tick = 0
+        while not worker.is_cancelled:
+            # Hold off while a confirm prompt is up so rows don't shift under it.
+            self._refresh_unpaused.wait()
+            if worker.is_cancelled:
+                return
+            # Node/docker feed notifications and stats feed the status bar, so
+            # they are always collected; the rest for the visible tab, with the
+            # process list also sampled every few passes for exports.
+            tab = self._current_tab
+            include_claude = self._has_claude and tick % _CLAUDE_REFRESH_EVERY == 0
+            pool = self._collector_pool
+            futures: dict[str, Future] = {
+                "node": pool.submit(get_node_processes),
+                "docker": pool.submit(get_docker_containers),
+                "stats": pool.submit(get_system_stats),
+            }
+            if tab == "system" or tick % _ALL_PROCS_REFRESH_EVERY == 0:
+                futures["all"] = pool.submit(get_all_processes, limit=self._config.process_limit)
+            if include_claude:
+                futures["claude_instances"] = pool.submit(get_claude_instances)
+                if tab == "claude":
+                    # Run after the instances scan so projects reuse its cwds.
+                    futures["claude_projects"] = pool.submit(
+                        _after, futures["claude_instances"], get_claude_projects,
+                    )
+                    futures["claude_stats"] = pool.submit(get_claude_stats)
+                    futures["claude_sessions"] = pool.submit(get_all_recent_sessions)
+            # Collectors fail independently: a stuck or broken docker never
+            # blanks the node table. A failed collector keeps its last data.
+            results = {}
+            for key, future in futures.items():
+                try:
+                    results[key] = future.result()
+                except Exception:
+                    pass
+            node_procs = results.get("node", self.node_procs)
+            docker_containers = results.get("docker", self.docker_containers)
+            stats = results.get("stats", self.system_stats)
+            all_procs = results.get("all")
+            claude_instances = results.get("claude_instances")
+            claude_projects = results.get("claude_projects")
+            claude_stats = results.get("claude_stats")
+            claude_sessions = results.get("claude_sessions")
+            # Fully formatted rows and their filter blobs, so the UI thread only diffs.
+            rows = {
+                "node-table": {str(p.pid): _node_row(p) for p in node_procs},
+                "docker-table": {c.container_id: _docker_row(c) for c in docker_containers},
+            }
+            if all_procs is not None:
+                rows["all-procs-table"] = {str(p.pid): _proc_row(p) for p in all_procs}
+            if claude_instances is not None:
+                rows["claude-instances-table"] = {str(i.pid): _claude_row(i) for i in claude_instances}
+            plain = {
+                table_id: {key: _plain_cells(cells) for key, cells in table_rows.items()}
+                for table_id, table_rows in rows.items()
+            }
+            search = {
+                table_id: {key: _search_blob(text) for key, text in table_plain.items()}
+                for table_id, table_plain in plain.items()
+            }
+            if worker.is_cancelled:
+                return
+            # Without system stats the tables still update; only the status
+            # bar summary waits for the next successful pass.
+            summary = None
+            if stats is not None:
+                claude_count = len(claude_instances if claude_instances is not None else self.claude_instances)
+                summary = self._status_summary(stats, len(node_procs), len(docker_containers), claude_count)
+            self.call_from_thread(self._update_all, node_procs, docker_containers, all_procs, stats, rows, plain, search, summary, claude_instances, claude_projects, claude_stats, claude_sessions)
+
+            # A manual refresh or tab switch (load_data) cuts the sleep short
+            # and forces the Claude collectors on the next pass.
+            woken = self._refresh_event.wait(self._config.refresh_rate)
+            self._refresh_event.clear()
+            tick = 0 if woken else tick + 1
 
     def _update_all(
         self,
         node_procs: list[NodeProcess],
         docker_containers: list[DockerContainer],
-        all_procs: list[GeneralProcess],
-        stats: SystemStats,
+        all_procs: list[GeneralProcess] | None,
+        stats: SystemStats | None,
+        rows: dict[str, dict[str, list]],
+        plain: dict[str, dict[str, tuple[str, ...]]],
+        search: dict[str, dict[str, str]],
+        summary: str | None,
         claude_instances: list[ClaudeInstance] | None = None,
         claude_projects: list[ClaudeProject] | None = None,
         claude_stats: ClaudeStats | None = None,
@@ -634,42 +1089,73 @@ class DevDashApp(App):
         self._update_idle_tracker(node_procs)
 
         self.node_procs = node_procs
+        self._node_by_pid = {p.pid: p for p in node_procs}
         self.docker_containers = docker_containers
-        self.all_procs = all_procs
+        self._docker_by_id = {c.container_id: c for c in docker_containers}
+        if all_procs is not None:
+            self.all_procs = all_procs
+            self._all_by_pid = {p.pid: p for p in all_procs}
         self.system_stats = stats
+        # Tables not collected this pass keep their previous rows and blobs.
+        self._rows = {**self._rows, **rows}
+        self._row_plain = {**self._row_plain, **plain}
+        self._row_search = {**self._row_search, **search}
         if claude_instances is not None:
             self.claude_instances = claude_instances
+            self._claude_by_pid = {i.pid: i for i in claude_instances}
+        # Projects and sessions build their filter blobs lazily while painting;
+        # fresh data makes those stale, so they are rebuilt from scratch.
         if claude_projects is not None:
             self.claude_projects = claude_projects
+            self._row_search.pop("claude-projects-table", None)
         if claude_stats is not None:
             self.claude_stats = claude_stats
         if claude_sessions is not None:
             self.claude_recent_sessions = claude_sessions
-
-        self._update_dev_tables(node_procs, docker_containers)
-        self._update_system_tab(all_procs, stats)
-        if self._has_claude:
-            self._update_claude_tab(self.claude_instances, self.claude_projects, self.claude_recent_sessions)
-            self._update_claude_stats_bar(self.claude_stats)
-
-        status = self.query_one("#status-bar", StatusBar)
-        cpu = f"CPU {stats.cpu_percent:.0f}%"
-        mem = f"Mem {stats.memory_used_gb:.1f}/{stats.memory_total_gb:.1f}GB"
-        disk = f"Disk {stats.disk_percent:.0f}%"
-        parts = f" {cpu} | {mem} | {disk} | {len(node_procs)} node | {len(docker_containers)} docker"
-        if self._has_claude:
-            parts += f" | {len(self.claude_instances)} claude"
-        tabs_hint = "1/2/3=tabs" if self._has_claude else "1/2=tabs"
-        status.message = f"{parts} | {tabs_hint} q=quit"
+            self._sessions_by_id = {e.session_id: e for e in claude_sessions}
+            self._row_search.pop("claude-sessions-table", None)
+
+        with self.batch_update():
+            self._render_tab(self._current_tab)
+            self._refresh_selection_display()
+
+        # StatusBar.message is reactive, so an identical summary doesn't repaint.
+        if summary is not None:
+            self._w["status-bar"].message = summary
+
+    def _status_summary(self, stats: SystemStats, node_count: int, docker_count: int, claude_count: int) -> str:
+        """Build the status bar summary; called on the loader thread."""
+        key = (
+            round(stats.cpu_percent), round(stats.memory_used_gb, 1), round(stats.memory_total_gb, 1),
+            round(stats.disk_percent), node_count, docker_count, claude_count,
+        )
+        if key == self._status_key:
+            return self._status_text
+        cpu, mem_used, mem_total, disk = key[:4]
+        claude_part = f" | {claude_count} claude" if self._has_claude else ""
+        self._status_key = key
+        self._status_text = (
+            f" CPU {cpu}% | Mem {mem_used:.1f}/{mem_total:.1f}GB"
+            f" | Disk {disk}% | {node_count} node | {docker_count} docker"
+            f"{claude_part} | {self._tabs_hint}"
+        )
+        return self._status_text
 
     def _check_notifications(
         self,
         node_procs: list[NodeProcess],
         docker_containers: list[DockerContainer],
     ) -> None:
-        current_pids = {p.pid for p in node_procs}
+        prev_pids = self._prev_node_pids
+        current_pids: set[int] = set()
+        current_ports: dict[int, tuple[int, ...]] = {}
+        new_procs: list[NodeProcess] = []
+        for proc in node_procs:
+            current_pids.add(proc.pid)
+            current_ports[proc.pid] = proc.ports
+            if proc.pid not in prev_pids:
+                new_procs.append(proc)
         current_docker_ids = {c.container_id for c in docker_containers}
-        current_ports = {p.pid: p.ports for p in node_procs}
 
         if not self._tracking_initialized:
             self._prev_node_pids = current_pids
@@ -678,26 +1164,36 @@ class DevDashApp(App):
             self._tracking_initialized = True
             return
 
-        vanished_pids = self._prev_node_pids - current_pids
-        for pid in vanished_pids:
-            ports = self._prev_node_ports.get(pid, [])
+        events: list[tuple[str, str]] = []  # (message, severity)
+        for pid in prev_pids - current_pids:
+            ports = self._prev_node_ports.get(pid, ())
             port_str = f" (port {', '.join(str(p) for p in ports)})" if ports else ""
-            self.notify(f"Node process PID {pid}{port_str} exited", severity="warning", timeout=5)
+            events.append((f"Node process PID {pid}{port_str} exited", "warning"))
 
-        vanished_containers = self._prev_docker_ids - current_docker_ids
-        for cid in vanished_containers:
-            self.notify(f"Docker container {cid[:12]} stopped", severity="warning", timeout=5)
+        for cid in self._prev_docker_ids - current_docker_ids:
+            events.append((f"Docker container {cid[:12]} stopped", "warning"))
 
-        for proc in node_procs:
-            if proc.pid not in self._prev_node_pids and proc.ports:
-                port_str = ", ".join(str(p) for p in proc.ports)
-                self.notify(f"New node process PID {proc.pid} on port {port_str}", severity="information", timeout=5)
-            elif self._config.watched_ports and proc.ports:
+        for proc in new_procs:
+            if proc.ports:
+                events.append((f"New node process PID {proc.pid} on port {proc.ports_label}", "information"))
+
+        watched = self._watched_ports
+        if watched:
+            for proc in node_procs:
+                if not proc.ports or proc.pid not in prev_pids:
+                    continue
+                prev_ports = self._prev_node_ports.get(proc.pid, ())
                 for port in proc.ports:
-                    if port in self._config.watched_ports:
-                        prev_ports = self._prev_node_ports.get(proc.pid, [])
-                        if port not in prev_ports:
-                            self.notify(f"Watched port {port} active (PID {proc.pid})", severity="information", timeout=5)
+                    if port in watched and port not in prev_ports:
+                        events.append((f"Watched port {port} active (PID {proc.pid})", "information"))
+
+        if len(events) > 3:
+            severity = "warning" if any(sev == "warning" for _, sev in events) else "information"
+            summary = "\n".join(msg for msg, _ in events)
+            self.notify(f"{len(events)} changes:\n{summary}", severity=severity, timeout=8)
+        else:
+            for msg, severity in events:
+                self.notify(msg, severity=severity, timeout=5)
 
         self._prev_node_pids = current_pids
         self._prev_node_ports = current_ports
@@ -717,121 +1213,80 @@ class DevDashApp(App):
             if pid not in current_pids:
                 del self._idle_tracker[pid]
 
+    def _visible_rows(self, table_id: str) -> dict[str, list]:
+        """The loader's prebuilt rows for table_id, narrowed by the active filter."""
+        rows = self._rows.get(table_id, {})
+        if not self._filter_lower:
+            return rows
+        matches = self._row_matches_filter
+        return {key: cells for key, cells in rows.items() if matches(table_id, key, cells)}
+
+    def _render_unchanged(self, name: str, signature: tuple) -> bool:
+        """Record signature for name; True when it matches the previous render."""
+        if self._last_render.get(name) == signature:
+            return True
+        self._last_render[name] = signature
+        return False
+
     def _update_dev_tables(
         self, node_procs: list[NodeProcess], docker_containers: list[DockerContainer]
     ) -> None:
-        node_table = self.query_one("#node-table", DataTable)
-        docker_table = self.query_one("#docker-table", DataTable)
-
-        node_cursor = node_table.cursor_row
-        docker_cursor = docker_table.cursor_row
-
-        node_table.clear()
-        node_count = 0
-        for proc in node_procs:
-            ports = ", ".join(str(p) for p in proc.ports) if proc.ports else "-"
-            cells = [
-                str(proc.pid),
-                proc.project or "-",
-                ports,
-                _colored_memory(proc.memory_mb),
-                _colored_percent(proc.cpu_percent),
-                proc.uptime,
-                proc.cwd,
-                proc.command,
-            ]
-            if self._row_matches_filter(cells):
-                node_table.add_row(*cells, key=str(proc.pid))
-                node_count += 1
+        if self._render_unchanged("dev", (
+            id(node_procs), len(node_procs), id(docker_containers), len(docker_containers), self._filter_lower,
+            self._sort_state.get("node-table"), self._sort_state.get("docker-table"),
+        )):
+            return
+        node_table = self._w["node-table"]
+        docker_table = self._w["docker-table"]
 
-        docker_table.clear()
-        docker_count = 0
-        for container in docker_containers:
-            cells = [
-                container.container_id,
-                container.name,
-                container.image,
-                container.status,
-                container.ports or "-",
-                container.created,
-                container.compose_project or "-",
-                container.compose_service or "-",
-            ]
-            if self._row_matches_filter(cells):
-                docker_table.add_row(*cells, key=container.container_id)
-                docker_count += 1
-
-        if node_count and node_cursor is not None:
-            try:
-                node_table.move_cursor(row=min(node_cursor, node_count - 1))
-            except Exception:
-                pass
-        if docker_count and docker_cursor is not None:
-            try:
-                docker_table.move_cursor(row=min(docker_cursor, docker_count - 1))
-            except Exception:
-                pass
+        self._sync_table(node_table, self._visible_rows("node-table"))
+        self._sync_table(docker_table, self._visible_rows("docker-table"))
 
         self._apply_sort("node-table")
         self._apply_sort("docker-table")
 
-        node_header = self.query_one("#node-header", Static)
+        node_header = self._w["node-header"]
         node_header.update(f" Node Processes ({len(node_procs)})")
-        docker_header = self.query_one("#docker-header", Static)
+        docker_header = self._w["docker-header"]
         docker_header.update(f" Docker Containers ({len(docker_containers)})")
 
-    def _update_system_tab(self, all_procs: list[GeneralProcess], stats: SystemStats) -> None:
-        sys_widget = self.query_one("#sys-stats", Static)
-        output = Text()
-        output.append("  CPU   ")
-        output.append_text(_colored_bar(stats.cpu_percent))
-        output.append(f"   ({stats.cpu_count} cores)\n")
-        output.append("  Mem   ")
-        output.append_text(_colored_bar(stats.memory_percent))
-        output.append(f"   {stats.memory_used_gb:.1f} / {stats.memory_total_gb:.1f} GB\n")
-        output.append("  Swap  ")
-        output.append_text(_colored_bar(stats.swap_percent))
-        output.append(f"   {stats.swap_used_gb:.1f} / {stats.swap_total_gb:.1f} GB\n")
-        output.append("  Disk  ")
-        output.append_text(_colored_bar(stats.disk_percent))
-        output.append(f"   {stats.disk_used_gb:.0f} / {stats.disk_total_gb:.0f} GB  ({stats.disk_free_gb:.0f} GB free)\n")
-        if stats.net_sent_per_sec is not None and stats.net_recv_per_sec is not None:
-            up = _format_bytes_rate(stats.net_sent_per_sec)
-            down = _format_bytes_rate(stats.net_recv_per_sec)
-            output.append(f"  Net   Up: {up}  Down: {down}")
-        else:
-            output.append("  Net   N/A")
-        sys_widget.update(output)
-
-        table = self.query_one("#all-procs-table", DataTable)
-        cursor = table.cursor_row
-
-        table.clear()
-        proc_count = 0
-        for proc in all_procs:
-            cells = [
-                str(proc.pid),
-                proc.name,
-                _colored_percent(proc.cpu_percent),
-                _colored_memory(proc.memory_mb),
-                _colored_percent(proc.memory_percent),
-                proc.user,
-                proc.status,
-                proc.command,
-            ]
-            if self._row_matches_filter(cells):
-                table.add_row(*cells, key=str(proc.pid))
-                proc_count += 1
-
-        if proc_count and cursor is not None:
-            try:
-                table.move_cursor(row=min(cursor, proc_count - 1))
-            except Exception:
-                pass
+    def _update_system_tab(self, all_procs: list[GeneralProcess], stats: SystemStats | None) -> None:
+        if self._render_unchanged("system", (
+            id(all_procs), len(all_procs), id(stats), self._filter_lower, self._sort_state.get("all-procs-table"),
+        )):
+            return
+        # The stats panel waits for the first successful sample; the table doesn't.
+        if stats is not None:
+            if stats.net_sent_per_sec is not None and stats.net_recv_per_sec is not None:
+                up = _format_bytes_rate(stats.net_sent_per_sec)
+                down = _format_bytes_rate(stats.net_recv_per_sec)
+                net = f"  Net   Up: {up}  Down: {down}"
+            else:
+                net = "  Net   N/A"
+            parts = (
+                ("  CPU   ", ""),
+                (_bar_str(stats.cpu_percent), _severity_style(stats.cpu_percent)),
+                (f"   ({stats.cpu_count} cores)\n  Mem   ", ""),
+                (_bar_str(stats.memory_percent), _severity_style(stats.memory_percent)),
+                (f"   {stats.memory_used_gb:.1f} / {stats.memory_total_gb:.1f} GB\n  Swap  ", ""),
+                (_bar_str(stats.swap_percent), _severity_style(stats.swap_percent)),
+                (f"   {stats.swap_used_gb:.1f} / {stats.swap_total_gb:.1f} GB\n  Disk  ", ""),
+                (_bar_str(stats.disk_percent), _severity_style(stats.disk_percent)),
+                (f"   {stats.disk_used_gb:.0f} / {stats.disk_total_gb:.0f} GB  ({stats.disk_free_gb:.0f} GB free)\n{net}", ""),
+            )
+            if parts != self._sys_stats_parts:
+                self._sys_stats_parts = parts
+                self._w["sys-stats"].update(Text.assemble(*parts))
+
+        table = self._w["all-procs-table"]
+
+        proc_rows = self._visible_rows("all-procs-table")
+        self._sync_table(table, proc_rows)
+        proc_count = len(proc_rows)
 
         self._apply_sort("all-procs-table")
 
-        procs_header = self.query_one("#procs-header", Static)
+        procs_header = self._w["procs-header"]
         procs_header.update(f" All Processes ({proc_count}, by memory)")
 
     def _update_claude_tab(
@@ -840,32 +1295,22 @@ class DevDashApp(App):
         claude_projects: list[ClaudeProject],
         claude_sessions: list[ClaudeSessionEntry] | None = None,
     ) -> None:
-        inst_table = self.query_one("#claude-instances-table", DataTable)
-        proj_table = self.query_one("#claude-projects-table", DataTable)
-        sess_table = self.query_one("#claude-sessions-table", DataTable)
-
-        inst_cursor = inst_table.cursor_row
-        proj_cursor = proj_table.cursor_row
-        sess_cursor = sess_table.cursor_row
+        if self._render_unchanged("claude", (
+            id(claude_instances), len(claude_instances), id(claude_projects), len(claude_projects),
+            id(claude_sessions), self._filter_lower, self._sort_state.get("claude-instances-table"),
+            self._sort_state.get("claude-projects-table"), self._sort_state.get("claude-sessions-table"),
+        )):
+            return
+        inst_table = self._w["claude-instances-table"]
+        proj_table = self._w["claude-projects-table"]
+        sess_table = self._w["claude-sessions-table"]
 
-        inst_table.clear()
-        inst_count = 0
-        for inst in claude_instances:
-            cells = [
-                str(inst.pid),
-                inst.project or "-",
-                inst.tty,
-                _colored_memory(inst.memory_mb),
-                _colored_percent(inst.cpu_percent),
-                inst.uptime,
-                inst.cwd,
-            ]
-            if self._row_matches_filter(cells):
-                inst_table.add_row(*cells, key=str(inst.pid))
-                inst_count += 1
+        inst_rows = self._visible_rows("claude-instances-table")
+        self._sync_table(inst_table, inst_rows)
+        inst_count = len(inst_rows)
 
-        proj_table.clear()
-        proj_count = 0
+        proj_rows: dict[str, list] = {}
+        matches = self._row_matches_filter
         for proj in claude_projects:
             status = Text("running", style="bold green") if proj.is_running else Text("-", style="dim")
             cells = [
@@ -876,12 +1321,13 @@ class DevDashApp(App):
                 status,
                 proj.path,
             ]
-            if self._row_matches_filter(cells):
-                proj_table.add_row(*cells, key=proj.path)
-                proj_count += 1
+            if matches("claude-projects-table", proj.path, cells):
+                proj_rows[proj.path] = cells
+        self._sync_table(proj_table, proj_rows)
+        proj_count = len(proj_rows)
 
-        sess_table.clear()
-        sess_count = 0
+        sess_rows: dict[str, list] = {}
+        matches = self._row_matches_filter
         for sess in claude_sessions or []:
             project_name = Path(sess.project_path).name if sess.project_path else "-"
             summary = sess.summary or sess.first_prompt or "-"
@@ -895,42 +1341,27 @@ class DevDashApp(App):
                 sess.created,
                 sess.modified,
             ]
-            if self._row_matches_filter(cells):
-                sess_table.add_row(*cells, key=sess.session_id)
-                sess_count += 1
-
-        if inst_count and inst_cursor is not None:
-            try:
-                inst_table.move_cursor(row=min(inst_cursor, inst_count - 1))
-            except Exception:
-                pass
-        if proj_count and proj_cursor is not None:
-            try:
-                proj_table.move_cursor(row=min(proj_cursor, proj_count - 1))
-            except Exception:
-                pass
-        if sess_count and sess_cursor is not None:
-            try:
-                sess_table.move_cursor(row=min(sess_cursor, sess_count - 1))
-            except Exception:
-                pass
+            if matches("claude-sessions-table", sess.session_id, cells):
+                sess_rows[sess.session_id] = cells
+        self._sync_table(sess_table, sess_rows)
+        sess_count = len(sess_rows)
 
         self._apply_sort("claude-instances-table")
         self._apply_sort("claude-projects-table")
         self._apply_sort("claude-sessions-table")
 
-        inst_header = self.query_one("#claude-instances-header", Static)
+        inst_header = self._w["claude-instances-header"]
         inst_header.update(f" Running Instances ({inst_count})")
-        proj_header = self.query_one("#claude-projects-header", Static)
+        proj_header = self._w["claude-projects-header"]
         proj_header.update(f" Projects ({proj_count})")
-        sess_header = self.query_one("#claude-sessions-header", Static)
+        sess_header = self._w["claude-sessions-header"]
         sess_header.update(f" Recent Sessions ({sess_count})")
 
     def _get_claude_selected_path(self) -> str | None:
         if self._current_tab != "claude":
             return None
         table_id = self._focused_table_id()
-        table = self.query_one(f"#{table_id}", DataTable)
+        table = self._w[table_id]
         try:
             row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
         except Exception:
@@ -943,21 +1374,15 @@ class DevDashApp(App):
                 pid = int(row_key.value)
             except ValueError:
                 return None
-            inst = next((i for i in self.claude_instances if i.pid == pid), None)
+            inst = self._claude_by_pid.get(pid)
             if not inst:
                 return None
-            path = inst.cwd
-            if path.startswith("~"):
-                path = str(Path.home()) + path[1:]
-            return path
+            return inst.path
         elif table_id == "claude-sessions-table":
             session_id = row_key.value
-            sess = next((s for s in self.claude_recent_sessions if s.session_id == session_id), None)
+            sess = self._sessions_by_id.get(session_id)
             if sess and sess.project_path:
-                path = sess.project_path
-                if path.startswith("~"):
-                    path = str(Path.home()) + path[1:]
-                return path
+                return sess.project_path
         return None
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
@@ -971,18 +1396,15 @@ class DevDashApp(App):
                 pid = int(event.row_key.value)
             except ValueError:
                 return
-            inst = next((i for i in self.claude_instances if i.pid == pid), None)
+            inst = self._claude_by_pid.get(pid)
             if not inst:
                 return
-            path = inst.cwd
-            if path.startswith("~"):
-                path = str(Path.home()) + path[1:]
-            self._open_launch_menu(path)
+            self._open_launch_menu(inst.path)
         elif table_id == "claude-sessions-table":
             session_id = event.row_key.value
-            sess = next((s for s in self.claude_recent_sessions if s.session_id == session_id), None)
+            sess = self._sessions_by_id.get(session_id)
             if sess and sess.project_path:
-                self._on_session_selected(session_id, sess.project_path)
+                self._on_session_selected(session_id, sess.project_path, Path(sess.project_path).name)
 
     def action_launch_or_details(self) -> None:
         if self._current_tab == "claude":
@@ -996,19 +1418,17 @@ class DevDashApp(App):
         name = Path(path).name
         self.push_screen(
             LaunchMenuScreen(name, editor_cmd=self._editor_cmd),
-            callback=lambda action: self._on_launch_menu_selected(action, path),
+            callback=lambda action: self._on_launch_menu_selected(action, path, name),
         )
 
-    def _on_launch_menu_selected(self, action: str | None, path: str) -> None:
+    def _on_launch_menu_selected(self, action: str | None, path: str, name: str) -> None:
         if not action:
             return
-        import subprocess as sp
-        name = Path(path).name
 
         if action == "editor" and self._editor_cmd:
             editor_label = "Cursor" if "cursor" in self._editor_cmd else "VS Code"
             try:
-                sp.Popen([self._editor_cmd, path])
+                _spawn_detached(self._editor_cmd, path)
                 self.notify(f"Opening {name} in {editor_label}", timeout=3)
             except Exception as e:
                 self.notify(f"Failed: {e}", severity="error", timeout=5)
@@ -1016,7 +1436,7 @@ class DevDashApp(App):
 
         if action == "finder":
             try:
-                sp.Popen(["open", path])
+                _spawn_detached("open", path)
                 self.notify(f"Opening {name} in Finder", timeout=3)
             except Exception as e:
                 self.notify(f"Failed: {e}", severity="error", timeout=5)
@@ -1034,8 +1454,7 @@ class DevDashApp(App):
             return
         script = f'cd {_shell_quote(path)} && {cmd}'
         try:
-            sp.Popen(["osascript", "-e",
-                f'tell application "Terminal" to do script "{script}"'])
+            _terminal_do_script(script)
             self.notify(f"{cmd} in {name}", timeout=3)
         except Exception as e:
             self.notify(f"Failed: {e}", severity="error", timeout=5)
@@ -1049,85 +1468,69 @@ class DevDashApp(App):
         name = Path(path).name
         self.push_screen(
             SessionBrowserScreen(path, name),
-            callback=lambda session_id: self._on_session_selected(session_id, path),
+            callback=lambda session_id: self._on_session_selected(session_id, path, name),
         )
 
-    def _on_session_selected(self, session_id: str | None, path: str) -> None:
+    def _on_session_selected(self, session_id: str | None, path: str, name: str) -> None:
         if not session_id:
             return
-        import subprocess as sp
-        name = Path(path).name
         script = f'cd {_shell_quote(path)} && claude --resume {session_id}'
         try:
-            sp.Popen(["osascript", "-e",
-                f'tell application "Terminal" to do script "{script}"'])
+            _terminal_do_script(script)
             self.notify(f"Resuming session in {name}", timeout=3)
         except Exception as e:
             self.notify(f"Failed: {e}", severity="error", timeout=5)
 
     def action_refresh(self) -> None:
-        status = self.query_one("#status-bar", StatusBar)
+        status = self._w["status-bar"]
         status.message = " Refreshing..."
-        self.load_data()
+        # Trailing-edge debounce: a burst of presses wakes the loader once.
+        if self._refresh_timer is not None:
+            self._refresh_timer.stop()
+        self._refresh_timer = self.set_timer(0.25, self.load_data)
 
     @staticmethod
     def _build_sparkline(values: list[int], width: int | None = None) -> str:
-        blocks = " \u2581\u2582\u2583\u2584\u2585\u2586\u2587\u2588"
         if not values:
             return ""
         if width and len(values) < width:
             values = [0] * (width - len(values)) + values
-        max_val = max(values) if values else 1
-        if max_val == 0:
-            return blocks[0] * len(values)
-        return "".join(
-            blocks[min(int(v / max_val * 7) + (1 if v > 0 else 0), 8)]
-            for v in values
-        )
+        return _spark_blocks(tuple(values))
 
     @staticmethod
-    def _build_hour_bar(hour_counts: dict[int, int]) -> str:
-        blocks = " \u2581\u2582\u2583\u2584\u2585\u2586\u2587\u2588"
-        values = [hour_counts.get(h, 0) for h in range(24)]
-        max_val = max(values) if values else 1
-        if max_val == 0:
-            return blocks[0] * 24
-        return "".join(
-            blocks[min(int(v / max_val * 7) + (1 if v > 0 else 0), 8)]
-            for v in values
-        )
+    def _build_hour_bar(hour_counts: tuple[int, ...]) -> str:
+        return _spark_blocks(hour_counts)
 
-    def _format_tokens(self, n: int) -> str:
+    @staticmethod
+    def _format_tokens(n: int) -> str:
         if n >= 1_000_000:
-            return f"{n / 1_000_000:.1f}M"
+            tenths = (n + 50_000) // 100_000
+            return f"{tenths // 10}.{tenths % 10}M"
         if n >= 1_000:
-            return f"{n / 1_000:.0f}k"
+            return f"{(n + 500) // 1_000}k"
         return str(n)
 
     def _update_claude_stats_bar(self, stats: ClaudeStats | None) -> None:
-        bar = self.query_one("#claude-stats-bar", Static)
+        if self._render_unchanged("claude-stats", (id(stats),)):
+            return
+        bar = self._w["claude-stats-bar"]
         if not stats:
             bar.update("")
             return
 
-        total_tokens = sum(
-            inp + out + cache for inp, out, cache in stats.model_usage.values()
-        )
+        model_totals = [(model, sum(usage)) for model, usage in stats.model_usage.items()]
+        total_tokens = sum(total for _, total in model_totals)
         line1 = (
             f"  Sessions: {stats.total_sessions}  "
             f"Messages: {stats.total_messages}  "
             f"Tokens: {self._format_tokens(total_tokens)}"
         )
 
-        model_parts = []
-        for model, (inp, out, cache) in sorted(
-            stats.model_usage.items(),
-            key=lambda x: sum(x[1]),
-            reverse=True,
-        ):
-            short_name = model.replace("claude-", "")
-            total = inp + out + cache
-            model_parts.append(f"{short_name}: {self._format_tokens(total)}")
+        model_totals.sort(key=lambda x: x[1], reverse=True)
+        model_parts = [
+            f"{model.replace('claude-', '')}: {self._format_tokens(total)}"
+            for model, total in model_totals
+        ]
         line2 = "  " + "  ".join(model_parts) if model_parts else ""
 
         daily_values = [count for _, count in stats.daily_activity]
@@ -1139,7 +1542,7 @@ class DevDashApp(App):
 
     def action_toggle_select(self) -> None:
         active = self._focused_table_id()
-        table = self.query_one(f"#{active}", DataTable)
+        table = self._w[active]
         try:
             row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
         except Exception:
@@ -1151,39 +1554,44 @@ class DevDashApp(App):
             else:
                 self._selected_containers.add(key)
         else:
-            try:
-                pid = int(key)
-            except ValueError:
+            if not key.isdigit():
                 return
-            if pid in self._selected_pids:
-                self._selected_pids.discard(pid)
+            if key in self._selected_pids:
+                self._selected_pids.discard(key)
             else:
-                self._selected_pids.add(pid)
+                self._selected_pids.add(key)
         self._refresh_selection_display()
 
     def _refresh_selection_display(self) -> None:
-        for table_id, selected, is_pid in [
-            ("node-table", self._selected_pids, True),
-            ("all-procs-table", self._selected_pids, True),
-            ("docker-table", self._selected_containers, False),
-        ]:
-            try:
-                table = self.query_one(f"#{table_id}", DataTable)
-            except Exception:
-                continue
-            for row_key in table.rows:
-                key_val = row_key.value
-                match = (int(key_val) in selected) if is_pid else (key_val in selected)
-                try:
-                    first_col = list(table.columns.keys())[0]
-                    cell = table.get_cell(row_key, first_col)
-                    text = cell.plain if isinstance(cell, Text) else str(cell)
-                    if match and not text.startswith("*"):
-                        table.update_cell(row_key, first_col, Text(f"* {text}", style="bold cyan"))
-                    elif not match and text.startswith("* "):
-                        table.update_cell(row_key, first_col, text[2:])
-                except Exception:
-                    pass
+        """Add/remove the "* " marker only on rows whose selection state changed."""
+        with self.batch_update():
+            for table_id, selected in [
+                ("node-table", self._selected_pids),
+                ("all-procs-table", self._selected_pids),
+                ("docker-table", self._selected_containers),
+            ]:
+                table = self._w.get(table_id)
+                if table is None or not table.columns:
+                    continue
+                rows = table.rows
+                # Rows that left the table (filtered/vanished) lose their marker with them.
+                marked = {key for key in self._row_marked.get(table_id, ()) if key in rows}
+                desired = {key for key in selected if key in rows}
+                self._row_marked[table_id] = desired
+                first_col = next(iter(table.columns))
+                for key in desired - marked:
+                    try:
+                        text = self._cell_plain(table.get_cell(key, first_col))
+                        table.update_cell(key, first_col, Text(f"* {text}", style="bold cyan"))
+                    except Exception:
+                        pass
+                for key in marked - desired:
+                    try:
+                        text = self._cell_plain(table.get_cell(key, first_col))
+                        if text.startswith("* "):
+                            table.update_cell(key, first_col, text[2:])
+                    except Exception:
+                        pass
 
     def action_kill(self) -> None:
         has_selected = bool(self._selected_pids) or bool(self._selected_containers)
@@ -1198,6 +1606,32 @@ class DevDashApp(App):
         elif active == "all-procs-table":
             self._kill_general()
 
+    def _post_status(self, message: str) -> None:
+        """Set the status bar from a worker thread, coalescing bursts into one paint per frame."""
+        with self._status_lock:
+            schedule = self._status_pending is None
+            self._status_pending = message
+        if schedule:
+            self.call_from_thread(self.set_timer, 1 / 30, self._flush_status)
+
+    def _flush_status(self) -> None:
+        with self._status_lock:
+            message, self._status_pending = self._status_pending, None
+        status = self._w.get("status-bar")
+        if message is not None and status is not None:
+            status.message = message
+
+    def _confirm(self, message: str, callback: Callable[[bool], None]) -> None:
+        screen = self.get_screen("confirm")
+        screen.set_message(message)
+        self._refresh_unpaused.clear()
+
+        def on_result(confirmed: bool) -> None:
+            self._refresh_unpaused.set()
+            callback(confirmed)
+
+        self.push_screen(screen, callback=on_result)
+
     def _batch_kill(self) -> None:
         items = []
         if self._selected_pids:
@@ -1205,27 +1639,33 @@ class DevDashApp(App):
         if self._selected_containers:
             items.append(f"{len(self._selected_containers)} container(s)")
         msg = f"Kill/stop {', '.join(items)}?"
-        self.push_screen(
-            ConfirmScreen(msg),
-            callback=self._on_batch_kill_confirmed,
-        )
+        self._confirm(msg, self._on_batch_kill_confirmed)
 
     @work(thread=True)
     def _on_batch_kill_confirmed(self, confirmed: bool) -> None:
         if not confirmed:
             return
-        status = self.query_one("#status-bar", StatusBar)
+        pids = [int(pid) for pid in self._selected_pids]
+        container_ids = list(self._selected_containers)
+        total = len(pids) + len(container_ids)
+        if not total:
+            return
+        self._post_status(f" Killing/stopping {total} item(s)...")
         killed = 0
-        for pid in list(self._selected_pids):
-            self.call_from_thread(setattr, status, "message", f" Killing PID {pid}...")
-            if kill_process(pid):
-                killed += 1
         stopped = 0
-        for cid in list(self._selected_containers):
-            self.call_from_thread(setattr, status, "message", f" Stopping container {cid[:12]}...")
-            if stop_docker_container(cid):
-                stopped += 1
-        self.call_from_thread(setattr, status, "message", f" Killed {killed} process(es), stopped {stopped} container(s)")
+        # docker stop and process termination each block for seconds; run them side by side.
+        with ThreadPoolExecutor(max_workers=min(16, total), thread_name_prefix="devdash-kill") as pool:
+            kill_futures = [pool.submit(kill_process, pid) for pid in pids]
+            stop_futures = [pool.submit(stop_docker_container, cid) for cid in container_ids]
+            killing = set(kill_futures)
+            for done, future in enumerate(as_completed(kill_futures + stop_futures), start=1):
+                if future.result():
+                    if future in killing:
+                        killed += 1
+                    else:
+                        stopped += 1
+                self._post_status(f" Killing/stopping... {done}/{total}")
+        self._post_status(f" Killed {killed} process(es), stopped {stopped} container(s)")
         self._selected_pids.clear()
         self._selected_containers.clear()
         self.call_from_thread(self.load_data)
@@ -1234,7 +1674,7 @@ class DevDashApp(App):
         if self._focused_table_id() != "docker-table":
             self.notify("Select a Docker container first", severity="warning")
             return
-        docker_table = self.query_one("#docker-table", DataTable)
+        docker_table = self._w["docker-table"]
         if not self.docker_containers:
             return
         try:
@@ -1242,9 +1682,7 @@ class DevDashApp(App):
             container_id = row_key.value
         except Exception:
             return
-        container = next(
-            (c for c in self.docker_containers if c.container_id == container_id), None
-        )
+        container = self._docker_by_id.get(container_id)
         if container:
             self.push_screen(LogViewerScreen(container_id, container.name))
 
@@ -1260,34 +1698,59 @@ class DevDashApp(App):
                 self.push_screen(ClaudeProjectDetailScreen(path, name))
             return
         table_id = active
-        table = self.query_one(f"#{table_id}", DataTable)
+        table = self._w[table_id]
         try:
             row_key, _ = table.coordinate_to_cell_key(table.cursor_coordinate)
             pid = int(row_key.value)
         except Exception:
             return
         if table_id == "node-table":
-            proc = next((p for p in self.node_procs if p.pid == pid), None)
+            proc = self._node_by_pid.get(pid)
             name = proc.name if proc else str(pid)
         else:
-            proc = next((p for p in self.all_procs if p.pid == pid), None)
+            proc = self._all_by_pid.get(pid)
             name = proc.name if proc else str(pid)
         self.push_screen(ProcessDetailScreen(pid, name))
 
     def action_export(self) -> None:
+        self._export_snapshot(self.node_procs, self.docker_containers, self.all_procs, self.system_stats)
+
+    @work(thread=True, exclusive=True, group="export")
+    def _export_snapshot(
+        self,
+        node_procs: list[NodeProcess],
+        docker_containers: list[DockerContainer],
+        all_procs: list[GeneralProcess],
+        system_stats: SystemStats | None,
+    ) -> None:
         snapshot = {
             "timestamp": datetime.now().isoformat(),
-            "node_processes": [dataclasses.asdict(p) for p in self.node_procs],
-            "docker_containers": [dataclasses.asdict(c) for c in self.docker_containers],
-            "all_processes": [dataclasses.asdict(p) for p in self.all_procs],
-            "system_stats": dataclasses.asdict(self.system_stats) if self.system_stats else None,
+            "node_processes": node_procs,
+            "docker_containers": docker_containers,
+            "all_processes": all_procs,
+            "system_stats": system_stats,
         }
         export_dir = Path.home() / ".local" / "share" / "devdash"
-        export_dir.mkdir(parents=True, exist_ok=True)
         ts = datetime.now().strftime("%Y%m%d-%H%M%S")
         filepath = export_dir / f"snapshot-{ts}.json"
-        filepath.write_text(json.dumps(snapshot, indent=2, default=str))
-        self.notify(f"Exported to {filepath}", timeout=5)
+        try:
+            export_dir.mkdir(parents=True, exist_ok=True)
+            # Compact by default; pretty-printing roughly doubles size and encode time.
+            pretty = self._config.export_pretty
+            if orjson is not None:
+                # orjson serializes dataclasses natively.
+                option = orjson.OPT_INDENT_2 if pretty else 0
+                filepath.write_bytes(orjson.dumps(snapshot, default=str, option=option))
+            else:
+                with filepath.open("w", encoding="utf-8") as f:
+                    if pretty:
+                        json.dump(snapshot, f, indent=2, default=_json_default)
+                    else:
+                        json.dump(snapshot, f, separators=(",", ":"), default=_json_default)
+        except OSError as e:
+            self.call_from_thread(self.notify, f"Export failed: {e}", severity="error", timeout=5)
+            return
+        self.call_from_thread(self.notify, f"Exported to {filepath}", timeout=5)
 
     def action_cleanup(self) -> None:
         self._compute_and_show_cleanup()
@@ -1324,25 +1787,21 @@ class DevDashApp(App):
         if stops:
             parts.append(f"Stop {len(stops)} container(s)")
         msg = " and ".join(parts) + "?"
-        self.push_screen(
-            ConfirmScreen(msg),
-            callback=lambda confirmed: self._execute_cleanup(confirmed, selected),
-        )
+        self._confirm(msg, lambda confirmed: self._execute_cleanup(confirmed, selected))
 
     @work(thread=True)
     def _execute_cleanup(self, confirmed: bool, items: list) -> None:
         if not confirmed:
             return
-        status = self.query_one("#status-bar", StatusBar)
         killed = 0
         stopped = 0
         for item in items:
             if item.action_type == "kill" and item.pid is not None:
-                self.call_from_thread(setattr, status, "message", f" Killing {item.label}...")
+                self._post_status(f" Killing {item.label}...")
                 if kill_process(item.pid):
                     killed += 1
             elif item.action_type == "stop_container" and item.container_id is not None:
-                self.call_from_thread(setattr, status, "message", f" Stopping {item.label}...")
+                self._post_status(f" Stopping {item.label}...")
                 if stop_docker_container(item.container_id):
                     stopped += 1
         parts = []
@@ -1351,7 +1810,7 @@ class DevDashApp(App):
         if stopped:
             parts.append(f"stopped {stopped} container(s)")
         summary = "Cleanup: " + ", ".join(parts) if parts else "No resources cleaned up"
-        self.call_from_thread(setattr, status, "message", f" {summary}")
+        self._post_status(f" {summary}")
         self.call_from_thread(self.notify, summary, timeout=5)
         self.call_from_thread(self.load_data)
 
@@ -1364,7 +1823,7 @@ class DevDashApp(App):
         self.push_screen(ActivityHeatmapScreen())
 
     def _kill_node(self) -> None:
-        node_table = self.query_one("#node-table", DataTable)
+        node_table = self._w["node-table"]
         if not self.node_procs:
             return
         try:
@@ -1373,21 +1832,24 @@ class DevDashApp(App):
         except Exception:
             return
 
-        proc = next((p for p in self.node_procs if p.pid == pid), None)
+        proc = self._node_by_pid.get(pid)
         if not proc:
             return
 
         label = f"PID {pid}"
         if proc.ports:
-            label += f" (port {', '.join(str(p) for p in proc.ports)})"
-
-        self.push_screen(
-            ConfirmScreen(f"Kill node process {label}?"),
-            callback=lambda confirmed: self._on_kill_confirmed(confirmed, pid),
+            label += f" (port {proc.ports_label})"
+
+        self._confirm(
+            f"Kill node process {label}?",
+            lambda confirmed: self._run_action(
+                confirmed, functools.partial(kill_node_process, pid),
+                f" Killing PID {pid}...", f" Killed PID {pid}", f" Failed to kill PID {pid}",
+            ),
         )
 
     def _stop_docker(self) -> None:
-        docker_table = self.query_one("#docker-table", DataTable)
+        docker_table = self._w["docker-table"]
         if not self.docker_containers:
             return
         try:
@@ -1396,19 +1858,21 @@ class DevDashApp(App):
         except Exception:
             return
 
-        container = next(
-            (c for c in self.docker_containers if c.container_id == container_id), None
-        )
+        container = self._docker_by_id.get(container_id)
         if not container:
             return
 
-        self.push_screen(
-            ConfirmScreen(f"Stop container '{container.name}' ({container.image})?"),
-            callback=lambda confirmed: self._on_stop_confirmed(confirmed, container_id, container.name),
+        name = container.name
+        self._confirm(
+            f"Stop container '{name}' ({container.image})?",
+            lambda confirmed: self._run_action(
+                confirmed, functools.partial(stop_docker_container, container_id),
+                f" Stopping '{name}'...", f" Stopped '{name}'", f" Failed to stop '{name}'",
+            ),
         )
 
     def _kill_general(self) -> None:
-        table = self.query_one("#all-procs-table", DataTable)
+        table = self._w["all-procs-table"]
         if not self.all_procs:
             return
         try:
@@ -1417,46 +1881,25 @@ class DevDashApp(App):
         except Exception:
             return
 
-        proc = next((p for p in self.all_procs if p.pid == pid), None)
+        proc = self._all_by_pid.get(pid)
         if not proc:
             return
 
-        self.push_screen(
-            ConfirmScreen(f"Kill process '{proc.name}' (PID {pid}, {proc.memory_mb:.0f} MB)?"),
-            callback=lambda confirmed: self._on_general_kill_confirmed(confirmed, pid, proc.name),
+        name = proc.name
+        self._confirm(
+            f"Kill process '{name}' (PID {pid}, {proc.memory_mb:.0f} MB)?",
+            lambda confirmed: self._run_action(
+                confirmed, functools.partial(kill_process, pid),
+                f" Killing '{name}' (PID {pid})...", f" Killed '{name}'", f" Failed to kill '{name}'",
+            ),
         )
 
-    @work(thread=True)
-    def _on_kill_confirmed(self, confirmed: bool, pid: int) -> None:
-        if not confirmed:
-            return
-        status = self.query_one("#status-bar", StatusBar)
-        self.call_from_thread(setattr, status, "message", f" Killing PID {pid}...")
-        success = kill_node_process(pid)
-        msg = f" Killed PID {pid}" if success else f" Failed to kill PID {pid}"
-        self.call_from_thread(setattr, status, "message", msg)
-        self.call_from_thread(self.load_data)
-
-    @work(thread=True)
-    def _on_stop_confirmed(self, confirmed: bool, container_id: str, name: str) -> None:
-        if not confirmed:
-            return
-        status = self.query_one("#status-bar", StatusBar)
-        self.call_from_thread(setattr, status, "message", f" Stopping '{name}'...")
-        success = stop_docker_container(container_id)
-        msg = f" Stopped '{name}'" if success else f" Failed to stop '{name}'"
-        self.call_from_thread(setattr, status, "message", msg)
-        self.call_from_thread(self.load_data)
-
-    @work(thread=True)
-    def _on_general_kill_confirmed(self, confirmed: bool, pid: int, name: str) -> None:
-        if not confirmed:
-            return
-        status = self.query_one("#status-bar", StatusBar)
-        self.call_from_thread(setattr, status, "message", f" Killing '{name}' (PID {pid})...")
-        success = kill_process(pid)
-        msg = f" Killed '{name}'" if success else f" Failed to kill '{name}'"
-        self.call_from_thread(setattr, status, "message", msg)
-        self.call_from_thread(self.load_data)
-
+    def _run_action(self, confirmed: bool, op: Callable[[], bool], before: str, ok: str, fail: str) -> None:
+        """Run a confirmed kill/stop on the shared action thread, reporting via the status bar."""
+        if confirmed:
+            self._action_pool.submit(self._action_job, op, before, ok, fail)
 
+    def _action_job(self, op: Callable[[], bool], before: str, ok: str, fail: str) -> None:
+        self._post_status(before)
+        self._post_status(ok if op() else fail)
+        self.load_data()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import sys
 import threading
 from pathlib import Path
@@ -9,6 +10,18 @@ from devdash import __version__
 from devdash.config import Config
 
 
+def _fast_event_loop() -> asyncio.AbstractEventLoop | None:
+    """Return a uvloop (winloop on Windows) event loop if the 'fast' extra is installed."""
+    try:
+        if sys.platform == "win32":
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return None
+    return loop_impl.new_event_loop()
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Developer dashboard for Node and Docker")
     parser.add_argument("--config", type=Path, default=None, help="Path to config file")
@@ -22,18 +35,16 @@ def main() -> None:
         perform_update()
         sys.exit(0)
 
-    update_event = threading.Event()
-    update_message: list[str | None] = [None]
+    from devdash.updater import UpdateResult
+
+    update = UpdateResult()
 
     def _bg_update_check() -> None:
         from devdash.updater import check_for_update, should_check_for_update
 
-        if not should_check_for_update():
-            update_event.set()
-            return
-        msg = check_for_update()
-        update_message[0] = msg
-        update_event.set()
+        if should_check_for_update():
+            update.message = check_for_update()
+        update.done.set()
 
     thread = threading.Thread(target=_bg_update_check, daemon=True)
     thread.start()
@@ -42,12 +53,13 @@ def main() -> None:
 
     from devdash.app import DevDashApp
 
-    app = DevDashApp(
-        config=config,
-        update_check_event=update_event,
-        get_update_message=lambda: update_message[0],
-    )
-    app.run()
+    app = DevDashApp(config=config, update=update)
+    loop = _fast_event_loop()
+    try:
+        app.run(loop=loop)
+    finally:
+        if loop is not None:
+            loop.close()
 
 
 if __name__ == "__main__":
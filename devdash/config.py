@@ -4,14 +4,6 @@ import sys
 from dataclasses import dataclass, field
 from pathlib import Path
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    try:
-        import tomli as tomllib
-    except ImportError:
-        tomllib = None
-
 DEFAULT_CONFIG_PATH = Path.home() / ".config" / "devdash" / "config.toml"
 
 
@@ -25,14 +17,21 @@ class Config:
     cleanup_idle_threshold_cpu: float = 1.0
     cleanup_idle_threshold_minutes: int = 10
     cleanup_docker_stale_days: int = 7
+    export_pretty: bool = False
 
     @classmethod
     def load(cls, path: Path | None = None) -> Config:
         config_path = path or DEFAULT_CONFIG_PATH
         if not config_path.exists():
             return cls()
-        if tomllib is None:
-            return cls()
+        # Imported here so the common no-config startup skips the TOML parser.
+        if sys.version_info >= (3, 11):
+            import tomllib
+        else:
+            try:
+                import tomli as tomllib
+            except ImportError:
+                return cls()
         try:
             with open(config_path, "rb") as f:
                 data = tomllib.load(f)
@@ -47,4 +46,5 @@ class Config:
             cleanup_idle_threshold_cpu=float(data.get("cleanup_idle_threshold_cpu", cls.cleanup_idle_threshold_cpu)),
             cleanup_idle_threshold_minutes=int(data.get("cleanup_idle_threshold_minutes", cls.cleanup_idle_threshold_minutes)),
             cleanup_docker_stale_days=int(data.get("cleanup_docker_stale_days", cls.cleanup_docker_stale_days)),
+            export_pretty=bool(data.get("export_pretty", cls.export_pretty)),
         )
@@ -1,42 +1,118 @@
 from __future__ import annotations
 
+import heapq
+import http.client
 import json
+import os
 import re
+import socket
+import stat
 import subprocess
+import sys
+import threading
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from operator import itemgetter
 from pathlib import Path
 
 import psutil
 
-_project_name_cache: dict[str, str] = {}
+try:
+    import orjson
+except ImportError:  # optional: pip install devdash[fast]
+    orjson = None
+
+_json_loads = orjson.loads if orjson is not None else json.loads
+
+_HOME = str(Path.home())
+_HOME_PREFIX = _HOME.rstrip(os.sep) + os.sep
+
+_CLAUDE_DIR = Path(_HOME) / ".claude"
+_CLAUDE_PROJECTS = _CLAUDE_DIR / "projects"
+_CLAUDE_HISTORY = _CLAUDE_DIR / "history.jsonl"
+_CLAUDE_STATS = _CLAUDE_DIR / "stats-cache.json"
+_CLAUDE_META_DIR = _CLAUDE_DIR / "usage-data" / "session-meta"
+
+# The package.json naming the project of each directory walked ("" when there
+# is none up to /), so sibling cwds under one project root share a single walk.
+_PROJECT_CACHE_MAX = 1024
+_project_pkg_cache: dict[str, str] = {}
+
+# "name" of each package.json with the (mtime_ns, size) it was parsed at. Every
+# lookup stats the file, so an edited package.json is parsed again on the next
+# lookup of a new process; an unchanged one never is.
+_package_name_cache: dict[str, tuple[int, int, str]] = {}
+
+
+def _trim_cache(cache: dict) -> None:
+    """Drop the oldest entries past _PROJECT_CACHE_MAX."""
+    while len(cache) > _PROJECT_CACHE_MAX:
+        del cache[next(iter(cache))]
+
+
+def _expand_home(path: str) -> str:
+    return _HOME + path[1:] if path.startswith("~") else path
+
+
+def _package_json_name(pkg: str) -> tuple[bool, str]:
+    """(exists, name) for a package.json; name is "" if it can't be parsed."""
+    try:
+        st = os.stat(pkg)
+    except OSError:
+        return False, ""
+    if not stat.S_ISREG(st.st_mode):
+        return False, ""
+    cached = _package_name_cache.get(pkg)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return True, cached[2]
+    try:
+        with open(pkg, encoding="utf-8") as f:
+            name = json.load(f).get("name", "")
+    except (json.JSONDecodeError, OSError):
+        name = ""
+    _package_name_cache[pkg] = (st.st_mtime_ns, st.st_size, name)
+    _trim_cache(_package_name_cache)
+    return True, name
 
 
 def _find_project_name(cwd: str) -> str:
     if not cwd:
         return ""
-    if cwd in _project_name_cache:
-        return _project_name_cache[cwd]
+    pkg = ""
+    name = ""
+    walked = []
     try:
         path = Path(cwd).resolve()
-        for directory in [path, *path.parents]:
-            pkg = directory / "package.json"
-            if pkg.is_file():
-                try:
-                    data = json.loads(pkg.read_text(encoding="utf-8"))
-                    name = data.get("name", "")
-                    _project_name_cache[cwd] = name
-                    return name
-                except (json.JSONDecodeError, OSError):
+        keys = [str(directory) for directory in [path, *path.parents]]
+        if keys[0] != cwd:
+            keys.insert(0, cwd)
+        for key in keys:
+            cached = _project_pkg_cache.get(key)
+            if cached == "":
+                break
+            if cached is not None:
+                # Still validated: the file may have been edited or removed.
+                found, name = _package_json_name(cached)
+                if found:
+                    pkg = cached
                     break
+            walked.append(key)
+            candidate = os.path.join(key, "package.json")
+            found, name = _package_json_name(candidate)
+            if found:
+                pkg = candidate
+                break
     except Exception:
-        pass
-    _project_name_cache[cwd] = ""
-    return ""
+        pkg = name = ""
+    for key in walked:
+        _project_pkg_cache[key] = pkg
+    _trim_cache(_project_pkg_cache)
+    return name
 
 
-@dataclass
+@dataclass(slots=True)
 class NodeProcess:
     pid: int
     name: str
@@ -44,12 +120,13 @@ class NodeProcess:
     cpu_percent: float
     memory_mb: float
     cwd: str
-    ports: list[int] = field(default_factory=list)
+    ports: tuple[int, ...] = ()  # shared empty tuple, no per-instance list
+    ports_label: str = "-"  # ports pre-joined for display, "-" when none
     uptime: str = ""
     project: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DockerContainer:
     container_id: str
     name: str
@@ -62,20 +139,19 @@ class DockerContainer:
 
 
 def _format_uptime(seconds: float) -> str:
-    if seconds < 60:
-        return f"{int(seconds)}s"
-    if seconds < 3600:
-        return f"{int(seconds // 60)}m"
-    if seconds < 86400:
-        h = int(seconds // 3600)
-        m = int((seconds % 3600) // 60)
-        return f"{h}h {m}m"
-    d = int(seconds // 86400)
-    h = int((seconds % 86400) // 3600)
-    return f"{d}d {h}h"
-
-
-def _get_process_ports(pid: int) -> list[int]:
+    s = int(seconds)
+    if s < 60:
+        return f"{s}s"
+    d, r = divmod(s, 86400)
+    h, r = divmod(r, 3600)
+    if d:
+        return f"{d}d {h}h"
+    if h:
+        return f"{h}h {r // 60}m"
+    return f"{r // 60}m"
+
+
+def _get_process_ports(pid: int) -> tuple[int, ...]:
     ports = set()
     try:
         for conn in psutil.Process(pid).net_connections(kind="inet"):
@@ -83,90 +159,357 @@ def _get_process_ports(pid: int) -> list[int]:
                 ports.add(conn.laddr.port)
     except (psutil.AccessDenied, psutil.NoSuchProcess):
         pass
-    return sorted(ports)
+    return tuple(sorted(ports))
 
 
-def _shorten_cwd(cwd: str) -> str:
-    home = str(psutil.Path.home()) if hasattr(psutil, "Path") else ""
+def _build_listen_port_index() -> dict[int, tuple[int, ...]] | None:
+    """Map pid -> sorted LISTEN ports from one system-wide connection scan.
+
+    Returns None when the scan is not permitted (macOS without root), so the
+    caller can fall back to per-process lookups.
+    """
+    index: dict[int, set[int]] = {}
     try:
-        from pathlib import Path
-        home = str(Path.home())
-        if cwd.startswith(home):
-            cwd = "~" + cwd[len(home):]
-    except Exception:
-        pass
+        connections = psutil.net_connections(kind="inet")
+    except psutil.AccessDenied:
+        return None
+    for conn in connections:
+        if conn.status == psutil.CONN_LISTEN and conn.laddr and conn.pid is not None:
+            index.setdefault(conn.pid, set()).add(conn.laddr.port)
+    return {pid: tuple(sorted(ports)) for pid, ports in index.items()}
+
+
+def _shorten_cwd(cwd: str) -> str:
+    if cwd.startswith(_HOME_PREFIX) or cwd == _HOME:
+        return "~" + cwd[len(_HOME):]
     return cwd
 
 
 def _shorten_command(cmdline: list[str]) -> str:
-    cmd = " ".join(cmdline)
-    if len(cmd) > 120:
-        cmd = cmd[:117] + "..."
-    return cmd
+    # Join only as many args as can show; electron-style argv can be huge.
+    length = -1
+    for i, part in enumerate(cmdline):
+        length += len(part) + 1
+        if length > 120:
+            return " ".join(cmdline[:i + 1])[:117] + "..."
+    return " ".join(cmdline)
+
+
+def _comm_candidate_pids(pattern: re.Pattern[bytes], keep_truncated: bool = True) -> list[int]:
+    """PIDs whose /proc/<pid>/comm matches pattern (Linux only).
+
+    One small read per process instead of psutil's stat/status/cmdline/cwd
+    reads. comm is capped at 15 bytes, so unless keep_truncated is False, names
+    that hit the cap are kept for the caller's full name/cmdline check.
+    """
+    pids = []
+    # Paths and contents stay bytes: nothing here needs str, so skip decoding.
+    with os.scandir(b"/proc") as it:
+        for entry in it:
+            name = entry.name
+            if not name.isdigit():
+                continue
+            try:
+                fd = os.open(b"/proc/" + name + b"/comm", os.O_RDONLY)
+            except OSError:
+                continue
+            try:
+                comm = os.read(fd, 64).rstrip(b"\n")
+            except OSError:
+                continue
+            finally:
+                os.close(fd)
+            if (keep_truncated and len(comm) >= 15) or pattern.search(comm):
+                pids.append(int(name))
+    return pids
+
+
+_NODE_ATTRS = ["pid", "name", "cmdline", "cwd", "create_time"]
+
+# Case-insensitive "node" in the process name, or in the last path component
+# of argv[0]; compiled once so rejecting non-node processes allocates nothing.
+_NODE_COMM_RE = re.compile(rb"node", re.IGNORECASE)
+_NODE_NAME_RE = re.compile(r"node", re.IGNORECASE)
+_NODE_ARGV0_RE = re.compile(r"node[^/]*$", re.IGNORECASE)
+
+# Process objects for node candidates, kept across refreshes.
+_node_proc_cache: dict[int, psutil.Process] = {}
+
+# Display strings that never change for a process, keyed by pid and checked
+# against create_time so a reused pid is not mistaken for the old process:
+# pid -> (create_time, name, command, cwd, project).
+_node_attr_cache: dict[int, tuple[float, str, str, str, str]] = {}
+
+
+def _iter_comm_candidates(
+    pattern: re.Pattern[bytes],
+    attrs: list[str],
+    cache: dict[int, psutil.Process],
+    keep_truncated: bool = True,
+) -> Iterator[psutil.Process]:
+    """Yield processes whose comm matches pattern, with .info filled in like
+    process_iter. Elsewhere than Linux, every process is yielded.
+
+    cache holds the Process objects between calls so cpu_percent() has a
+    baseline (process_iter keeps its own cache for the same reason).
+    """
+    if sys.platform != "linux":
+        yield from psutil.process_iter(attrs)
+        return
+    live: dict[int, psutil.Process] = {}
+    for pid in _comm_candidate_pids(pattern, keep_truncated):
+        proc = cache.get(pid)
+        try:
+            # attrs are read once per process; is_running() compares
+            # create_time, so pid reuse gets a new read.
+            if proc is None or not proc.is_running():
+                proc = psutil.Process(pid)
+                proc.info = proc.as_dict(attrs)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+        live[pid] = proc
+        yield proc
+    cache.clear()
+    cache.update(live)
+
+
+def _iter_node_candidates() -> Iterator[psutil.Process]:
+    """Yield possible node processes with .info filled in like process_iter."""
+    return _iter_comm_candidates(_NODE_COMM_RE, _NODE_ATTRS, _node_proc_cache)
 
 
 def get_node_processes() -> list[NodeProcess]:
     results = []
-    import time
+    attr_cache: dict[int, tuple[float, str, str, str, str]] = {}
+    now = time.time()
+
+    port_index = _build_listen_port_index()
 
-    for proc in psutil.process_iter(["pid", "name", "cmdline", "cwd", "create_time"]):
+    for proc in _iter_node_candidates():
         try:
             info = proc.info
             cmdline = info.get("cmdline") or []
             name = info.get("name", "")
 
-            is_node = False
-            if name and "node" in name.lower():
-                is_node = True
-            elif cmdline and any("node" in part.lower().split("/")[-1] for part in cmdline[:1]):
-                is_node = True
-
-            if not is_node:
+            if not (
+                (name and _NODE_NAME_RE.search(name))
+                or (cmdline and _NODE_ARGV0_RE.search(cmdline[0]))
+            ):
                 continue
 
             pid = info["pid"]
-            cwd = info.get("cwd") or ""
             create_time = info.get("create_time") or 0
-            uptime = time.time() - create_time if create_time else 0
-
-            try:
-                cpu = proc.cpu_percent(interval=0)
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                cpu = 0.0
+            attrs = _node_attr_cache.get(pid)
+            if attrs is None or attrs[0] != create_time:
+                cwd = info.get("cwd") or ""
+                attrs = (create_time, name, _shorten_command(cmdline), _shorten_cwd(cwd), _find_project_name(cwd))
+            attr_cache[pid] = attrs
+            uptime = now - create_time if create_time else 0
+
+            with proc.oneshot():
+                try:
+                    cpu = proc.cpu_percent(interval=0)
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    cpu = 0.0
 
-            try:
-                mem = proc.memory_info().rss / (1024 * 1024)
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                mem = 0.0
+                try:
+                    mem = proc.memory_info().rss / (1024 * 1024)
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    mem = 0.0
 
-            ports = _get_process_ports(pid)
-            project = _find_project_name(cwd)
+            ports = port_index.get(pid, ()) if port_index is not None else _get_process_ports(pid)
 
             results.append(NodeProcess(
                 pid=pid,
-                name=name,
-                command=_shorten_command(cmdline),
+                name=attrs[1],
+                command=attrs[2],
                 cpu_percent=cpu,
                 memory_mb=mem,
-                cwd=_shorten_cwd(cwd),
+                cwd=attrs[3],
                 ports=ports,
+                ports_label=", ".join(map(str, ports)) if ports else "-",
                 uptime=_format_uptime(uptime),
-                project=project,
+                project=attrs[4],
             ))
         except (psutil.AccessDenied, psutil.NoSuchProcess, psutil.ZombieProcess):
             continue
 
+    _node_attr_cache.clear()
+    _node_attr_cache.update(attr_cache)
     results.sort(key=lambda p: p.memory_mb, reverse=True)
     return results
 
 
-def get_docker_containers() -> list[DockerContainer]:
+def _make_container(
+    container_id: str, name: str, image: str, status: str, ports: str, created: str, labels: dict[str, str],
+) -> DockerContainer:
+    if len(ports) > 60:
+        ports = ports[:57] + "..."
+    return DockerContainer(
+        container_id=container_id,
+        name=name,
+        image=image,
+        status=status,
+        ports=ports,
+        created=created,
+        compose_project=labels.get("com.docker.compose.project", ""),
+        compose_service=labels.get("com.docker.compose.service", ""),
+    )
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTPConnection over a UNIX socket, for the Docker Engine API."""
+
+    def __init__(self, path: str, timeout: float) -> None:
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(self._socket_path)
+        except OSError:
+            sock.close()
+            raise
+        self.sock = sock
+
+
+_docker_conn: _UnixHTTPConnection | None = None
+_docker_conn_lock = threading.Lock()
+
+
+def _docker_context() -> str:
+    """Name of the docker CLI's current context, resolved the way the CLI does."""
+    context = os.environ.get("DOCKER_CONTEXT", "")
+    if context:
+        return context
+    config_dir = os.environ.get("DOCKER_CONFIG") or os.path.join(_HOME, ".docker")
+    try:
+        with open(os.path.join(config_dir, "config.json"), "rb") as f:
+            config = _json_loads(f.read())
+    except (OSError, ValueError):
+        return "default"
+    context = config.get("currentContext") if isinstance(config, dict) else None
+    return context or "default"
+
+
+def _docker_socket_path() -> str | None:
+    """UNIX socket of the daemon `docker` would talk to; None means use the CLI.
+
+    Only DOCKER_HOST and the default context are resolved here. Any other
+    context (colima, rootless, remote, Docker Desktop) is left to the CLI so
+    the dashboard always shows the same daemon as `docker ps`.
+    """
+    host = os.environ.get("DOCKER_HOST", "")
+    if host:
+        return host[len("unix://"):] if host.startswith("unix://") else None
+    if not hasattr(socket, "AF_UNIX") or _docker_context() != "default":
+        return None
+    path = "/var/run/docker.sock"
+    return path if os.path.exists(path) else None
+
+
+def _docker_api_get(url: str) -> object | None:
+    """GET url from the Docker Engine API on a kept-alive socket; None if unreachable."""
+    global _docker_conn
+    with _docker_conn_lock:
+        # A reused connection may have been closed by the daemon; retry once fresh.
+        for _ in range(2):
+            if _docker_conn is None:
+                path = _docker_socket_path()
+                if path is None:
+                    return None
+                _docker_conn = _UnixHTTPConnection(path, timeout=5)
+            try:
+                _docker_conn.request("GET", url)
+                response = _docker_conn.getresponse()
+                body = response.read()
+                break
+            except (OSError, http.client.HTTPException):
+                _docker_conn.close()
+                _docker_conn = None
+        else:
+            return None
+    if response.status != 200:
+        return None
     try:
+        return _json_loads(body)
+    except ValueError:
+        return None
+
+
+def _human_duration(seconds: float) -> str:
+    """Mirror docker's units.HumanDuration so API results read like `docker ps`."""
+    if seconds < 1:
+        return "Less than a second"
+    if int(seconds) == 1:
+        return "1 second"
+    if seconds < 60:
+        return f"{int(seconds)} seconds"
+    minutes = int(seconds / 60)
+    if minutes == 1:
+        return "About a minute"
+    if minutes < 60:
+        return f"{minutes} minutes"
+    hours = int(seconds / 3600 + 0.5)
+    if hours == 1:
+        return "About an hour"
+    if hours < 48:
+        return f"{hours} hours"
+    if hours < 24 * 7 * 2:
+        return f"{hours // 24} days"
+    if hours < 24 * 30 * 2:
+        return f"{hours // 24 // 7} weeks"
+    if hours < 24 * 365 * 2:
+        return f"{hours // 24 // 30} months"
+    return f"{int(seconds / 3600) // 24 // 365} years"
+
+
+def _format_api_ports(ports: list[dict]) -> str:
+    parts = []
+    for port in sorted(ports, key=lambda p: (p.get("PrivatePort", 0), p.get("Type", ""), p.get("IP", ""))):
+        private = f"{port.get('PrivatePort')}/{port.get('Type', 'tcp')}"
+        public = port.get("PublicPort")
+        if public:
+            ip = port.get("IP", "")
+            if ":" in ip:
+                ip = f"[{ip}]"
+            parts.append(f"{ip}:{public}->{private}")
+        else:
+            parts.append(private)
+    return ", ".join(parts)
+
+
+def _docker_api_containers() -> list[DockerContainer] | None:
+    rows = _docker_api_get("/containers/json")
+    if not isinstance(rows, list):
+        return None
+    now = time.time()
+    containers = []
+    for data in rows:
+        try:
+            # Names carry a leading "/"; names with another "/" are legacy links.
+            names = [n[1:] for n in data.get("Names") or [] if "/" not in n[1:]]
+            containers.append(_make_container(
+                container_id=data["Id"][:12],
+                name=",".join(names),
+                image=data["Image"],
+                status=data["Status"],
+                ports=_format_api_ports(data.get("Ports") or []),
+                created=_human_duration(now - data["Created"]) + " ago",
+                labels=data.get("Labels") or {},
+            ))
+        except (KeyError, TypeError, AttributeError):
+            continue
+    return containers
+
+
+def _docker_cli_containers() -> list[DockerContainer]:
+    try:
+        # {{json .}} lets docker do the escaping, one object per line.
         result = subprocess.run(
-            [
-                "docker", "ps", "--format",
-                '{"id":"{{.ID}}","name":"{{.Names}}","image":"{{.Image}}","status":"{{.Status}}","ports":"{{.Ports}}","created":"{{.RunningFor}}","labels":"{{.Labels}}"}'
-            ],
+            ["docker", "ps", "--format", "{{json .}}"],
             capture_output=True,
             text=True,
             timeout=5,
@@ -176,35 +519,45 @@ def get_docker_containers() -> list[DockerContainer]:
     except (FileNotFoundError, subprocess.TimeoutExpired):
         return []
 
+    lines = [line for line in result.stdout.splitlines() if line.strip()]
+    if not lines:
+        return []
+    try:
+        # One parse over a JSON array instead of one json.loads per line.
+        rows = _json_loads("[" + ",".join(lines) + "]")
+    except ValueError:
+        return []
+
     containers = []
-    for line in result.stdout.strip().splitlines():
-        if not line.strip():
-            continue
+    for data in rows:
         try:
-            data = json.loads(line)
-            ports = data.get("ports", "")
-            if len(ports) > 60:
-                ports = ports[:57] + "..."
-            labels_str = data.get("labels", "")
+            labels_str = data.get("Labels", "")
             labels = {}
             if labels_str:
                 for part in labels_str.split(","):
                     if "=" in part:
                         k, v = part.split("=", 1)
                         labels[k.strip()] = v.strip()
-            containers.append(DockerContainer(
-                container_id=data["id"],
-                name=data["name"],
-                image=data["image"],
-                status=data["status"],
-                ports=ports,
-                created=data["created"],
-                compose_project=labels.get("com.docker.compose.project", ""),
-                compose_service=labels.get("com.docker.compose.service", ""),
+            containers.append(_make_container(
+                container_id=data["ID"],
+                name=data["Names"],
+                image=data["Image"],
+                status=data["Status"],
+                ports=data.get("Ports", ""),
+                created=data["RunningFor"],
+                labels=labels,
             ))
-        except (json.JSONDecodeError, KeyError):
+        except (KeyError, AttributeError):
             continue
+    return containers
+
 
+def get_docker_containers() -> list[DockerContainer]:
+    # The Engine API over the local socket avoids a docker CLI fork+exec per
+    # refresh; the CLI remains the fallback for remote hosts or no socket.
+    containers = _docker_api_containers()
+    if containers is None:
+        containers = _docker_cli_containers()
     containers.sort(key=lambda c: (c.compose_project, c.compose_service, c.name))
     return containers
 
@@ -271,12 +624,24 @@ def get_cleanup_suggestions(
                 ))
                 flagged_pids.add(proc.pid)
 
+    # One Process handle per node pid for the zombie and orphan checks, reusing
+    # the collector's cached handle when it has one.
+    handles: dict[int, psutil.Process] = {}
+    for proc in node_procs:
+        handle = _node_proc_cache.get(proc.pid)
+        if handle is None:
+            try:
+                handle = psutil.Process(proc.pid)
+            except psutil.NoSuchProcess:
+                continue
+        handles[proc.pid] = handle
+
     # Zombie processes (from node procs list)
     for proc in node_procs:
-        if proc.pid in flagged_pids:
+        p = handles.get(proc.pid)
+        if p is None or proc.pid in flagged_pids:
             continue
         try:
-            p = psutil.Process(proc.pid)
             if p.status() == psutil.STATUS_ZOMBIE:
                 suggestions.append(CleanupSuggestion(
                     category="zombie",
@@ -291,10 +656,10 @@ def get_cleanup_suggestions(
 
     # Orphan node processes (ppid=1 or parent doesn't exist)
     for proc in node_procs:
-        if proc.pid in flagged_pids:
+        p = handles.get(proc.pid)
+        if p is None or proc.pid in flagged_pids:
             continue
         try:
-            p = psutil.Process(proc.pid)
             ppid = p.ppid()
             if ppid <= 1:
                 suggestions.append(CleanupSuggestion(
@@ -410,7 +775,7 @@ def get_dependency_graph(
     for proc in node_procs:
         label = proc.project or proc.name
         group = proc.project or ""
-        owner = PortOwner(kind="node", label=label, group=group, pid=proc.pid, ports=proc.ports)
+        owner = PortOwner(kind="node", label=label, group=group, pid=proc.pid, ports=list(proc.ports))
         owners.append(owner)
         for port in proc.ports:
             port_to_owner[port] = owner
@@ -478,13 +843,47 @@ class ActivityHeatmapData:
     total_hours: float
 
 
+# Parsed session-meta files by path, with the (mtime_ns, size) they were read
+# at; a file is only parsed again after it changes.
+_meta_cache: dict[str, tuple[int, int, dict]] = {}
+
+
+def _session_metas() -> list[dict]:
+    """Parsed ~/.claude/usage-data/session-meta/*.json, from one scandir pass."""
+    fresh: dict[str, tuple[int, int, dict]] = {}
+    try:
+        with os.scandir(_CLAUDE_META_DIR) as it:
+            for entry in it:
+                if not entry.name.endswith(".json"):
+                    continue
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                cached = _meta_cache.get(entry.path)
+                if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                    fresh[entry.path] = cached
+                    continue
+                try:
+                    with open(entry.path, "rb") as f:
+                        meta = _json_loads(f.read())
+                except (ValueError, OSError):
+                    continue
+                if isinstance(meta, dict):
+                    fresh[entry.path] = (st.st_mtime_ns, st.st_size, meta)
+    except OSError:
+        pass
+    _meta_cache.clear()
+    _meta_cache.update(fresh)
+    return [meta for _, _, meta in fresh.values()]
+
+
 def get_activity_heatmap_data() -> ActivityHeatmapData | None:
     """Build activity heatmap from Claude stats and session data."""
     from datetime import timedelta
 
-    claude_dir = Path.home() / ".claude"
-    projects_dir = claude_dir / "projects"
-    stats_file = claude_dir / "stats-cache.json"
+    projects_dir = _CLAUDE_PROJECTS
+    stats_file = _CLAUDE_STATS
 
     if not stats_file.is_file() and not projects_dir.is_dir():
         return None
@@ -562,16 +961,10 @@ def get_activity_heatmap_data() -> ActivityHeatmapData | None:
                 total_hours += duration_hours
 
     # 3. Scan session-meta for per-project duration_minutes (more accurate if available)
-    meta_dir = claude_dir / "usage-data" / "session-meta"
-    if meta_dir.is_dir():
+    metas = _session_metas()
+    if metas:
         meta_project_hours: dict[str, float] = {}
-        for meta_file in meta_dir.iterdir():
-            if meta_file.suffix != ".json":
-                continue
-            try:
-                meta = json.loads(meta_file.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
-                continue
+        for meta in metas:
             proj_path = meta.get("project_path", "")
             duration_min = meta.get("duration_minutes", 0)
             if proj_path and duration_min:
@@ -612,7 +1005,36 @@ def kill_node_process(pid: int) -> bool:
         return False
 
 
+def _docker_api_stop(container_id: str) -> bool | None:
+    """POST /containers/<id>/stop; None if the API can't be reached at all.
+
+    Uses its own connection: the daemon holds the request open for the stop
+    grace period, which must not block the shared listing connection.
+    """
+    path = _docker_socket_path()
+    if path is None:
+        return None
+    conn = _UnixHTTPConnection(path, timeout=15)
+    try:
+        try:
+            conn.connect()
+        except OSError:
+            return None
+        try:
+            conn.request("POST", f"/containers/{container_id}/stop")
+            status = conn.getresponse().status
+        except (OSError, http.client.HTTPException):
+            return False
+    finally:
+        conn.close()
+    # 304: already stopped, which `docker stop` also reports as success.
+    return status in (204, 304)
+
+
 def stop_docker_container(container_id: str) -> bool:
+    stopped = _docker_api_stop(container_id)
+    if stopped is not None:
+        return stopped
     try:
         result = subprocess.run(
             ["docker", "stop", container_id],
@@ -625,7 +1047,7 @@ def stop_docker_container(container_id: str) -> bool:
         return False
 
 
-@dataclass
+@dataclass(slots=True)
 class SystemStats:
     cpu_percent: float
     cpu_count: int
@@ -645,8 +1067,12 @@ class SystemStats:
 
 _prev_net: tuple[float, float, float] | None = None  # (time, bytes_sent, bytes_recv)
 
+# Disk usage moves slowly; statvfs("/") is re-read at most this often.
+_DISK_TTL = 3.0
+_disk_cache: tuple[float, psutil._common.sdiskusage] | None = None  # (monotonic, usage)
 
-@dataclass
+
+@dataclass(slots=True)
 class GeneralProcess:
     pid: int
     name: str
@@ -667,12 +1093,15 @@ def _format_bytes_rate(bps: float) -> str:
 
 
 def get_system_stats() -> SystemStats:
-    global _prev_net
+    global _prev_net, _disk_cache
     cpu = psutil.cpu_percent(interval=0)
     cpu_count = psutil.cpu_count() or 1
     mem = psutil.virtual_memory()
     swap = psutil.swap_memory()
-    disk = psutil.disk_usage("/")
+    mono = time.monotonic()
+    if _disk_cache is None or mono - _disk_cache[0] >= _DISK_TTL:
+        _disk_cache = (mono, psutil.disk_usage("/"))
+    disk = _disk_cache[1]
 
     net_sent_ps: float | None = None
     net_recv_ps: float | None = None
@@ -707,49 +1136,40 @@ def get_system_stats() -> SystemStats:
 
 
 def get_all_processes(limit: int = 80) -> list[GeneralProcess]:
+    """Return the `limit` processes using the most memory, largest first."""
+    total_mem = psutil.virtual_memory().total or 1
+    candidates = []
+    # process_iter fetches attrs inside Process.oneshot(), so name, status, CPU
+    # times and memory share one read of each /proc file. CPU is sampled for
+    # every process so each one's next reading covers exactly one interval.
+    # Owner and cmdline cost a read each and are only fetched for shown rows.
+    attrs = ["pid", "name", "status", "cpu_percent", "memory_info"]
+    for proc in psutil.process_iter(attrs):
+        info = proc.info
+        mem_info = info["memory_info"]
+        candidates.append((mem_info.rss if mem_info else 0, info["cpu_percent"] or 0.0, info, proc))
+
+    # Only the top `limit` rows are shown, so select them with a heap and build
+    # dataclasses for those alone.
     results = []
-    for proc in psutil.process_iter(["pid", "name", "username", "status", "cmdline"]):
+    for rss, cpu, info, proc in heapq.nlargest(limit, candidates, key=itemgetter(0)):
         try:
-            info = proc.info
-            pid = info["pid"]
-            name = info.get("name") or ""
-            user = info.get("username") or ""
-            status = info.get("status") or ""
-            cmdline = info.get("cmdline") or []
-
-            try:
-                cpu = proc.cpu_percent(interval=0)
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                cpu = 0.0
-
-            try:
-                mem_info = proc.memory_info()
-                mem_mb = mem_info.rss / (1024 * 1024)
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                mem_mb = 0.0
-
-            try:
-                mem_pct = proc.memory_percent()
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                mem_pct = 0.0
-
-            cmd = _shorten_command(cmdline) if cmdline else name
-
-            results.append(GeneralProcess(
-                pid=pid,
-                name=name,
-                cpu_percent=cpu,
-                memory_mb=mem_mb,
-                memory_percent=mem_pct,
-                status=status,
-                user=user,
-                command=cmd,
-            ))
-        except (psutil.AccessDenied, psutil.NoSuchProcess, psutil.ZombieProcess):
+            info.update(proc.as_dict(["username", "cmdline"]))
+        except psutil.NoSuchProcess:
             continue
-
-    results.sort(key=lambda p: p.memory_mb, reverse=True)
-    return results[:limit]
+        name = info.get("name") or ""
+        cmdline = info.get("cmdline") or []
+        results.append(GeneralProcess(
+            pid=info["pid"],
+            name=name,
+            cpu_percent=cpu,
+            memory_mb=rss / (1024 * 1024),
+            memory_percent=rss / total_mem * 100,
+            status=info.get("status") or "",
+            user=info.get("username") or "",
+            command=_shorten_command(cmdline) if cmdline else name,
+        ))
+    return results
 
 
 def kill_process(pid: int) -> bool:
@@ -774,6 +1194,7 @@ class ClaudeInstance:
     cpu_percent: float
     memory_mb: float
     uptime: str
+    path: str = ""  # absolute cwd; cwd is shortened for display
 
 
 @dataclass
@@ -803,44 +1224,71 @@ def _format_relative_time(ts_ms: float) -> str:
     return f"{d // 30}mo ago"
 
 
+# cwds of running claude instances from the last get_claude_instances() pass,
+# reused by get_claude_projects() instead of scanning every process again.
+_CLAUDE_CWDS_TTL = 2.0
+_claude_cwds: tuple[float, frozenset[str]] | None = None  # (monotonic, cwds)
+
+
+def _running_claude_cwds() -> frozenset[str]:
+    cached = _claude_cwds
+    if cached is not None and time.monotonic() - cached[0] < _CLAUDE_CWDS_TTL:
+        return cached[1]
+    try:
+        get_claude_instances()
+    except Exception:
+        return frozenset()
+    return _claude_cwds[1] if _claude_cwds is not None else frozenset()
+
+
+_CLAUDE_ATTRS = ["pid", "name", "cwd", "create_time"]
+_CLAUDE_COMM_RE = re.compile(rb"\Aclaude\Z")
+_claude_proc_cache: dict[int, psutil.Process] = {}
+
+
 def get_claude_instances() -> list[ClaudeInstance]:
+    global _claude_cwds
     results = []
-    for proc in psutil.process_iter(["pid", "name", "cwd", "create_time"]):
+    now = time.time()
+    # The name must be exactly "claude", so a truncated comm can never match.
+    candidates = _iter_comm_candidates(_CLAUDE_COMM_RE, _CLAUDE_ATTRS, _claude_proc_cache, keep_truncated=False)
+    for proc in candidates:
         try:
             info = proc.info
             name = info.get("name") or ""
             if name != "claude":
                 continue
 
-            try:
-                exe = proc.exe()
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                exe = ""
-            if "/Applications/" in exe:
-                continue
+            # terminal() and cpu_percent() share one /proc/<pid>/stat read.
+            with proc.oneshot():
+                try:
+                    exe = proc.exe()
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    exe = ""
+                if "/Applications/" in exe:
+                    continue
 
-            try:
-                terminal = proc.terminal()
-            except (psutil.AccessDenied, psutil.NoSuchProcess, AttributeError):
-                terminal = None
-            if not terminal:
-                continue
+                try:
+                    terminal = proc.terminal()
+                except (psutil.AccessDenied, psutil.NoSuchProcess, AttributeError):
+                    terminal = None
+                if not terminal:
+                    continue
+
+                try:
+                    cpu = proc.cpu_percent(interval=0)
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    cpu = 0.0
+
+                try:
+                    mem = proc.memory_info().rss / (1024 * 1024)
+                except (psutil.AccessDenied, psutil.NoSuchProcess):
+                    mem = 0.0
 
             pid = info["pid"]
             cwd = info.get("cwd") or ""
             create_time = info.get("create_time") or 0
-            uptime = time.time() - create_time if create_time else 0
-
-            try:
-                cpu = proc.cpu_percent(interval=0)
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                cpu = 0.0
-
-            try:
-                mem = proc.memory_info().rss / (1024 * 1024)
-            except (psutil.AccessDenied, psutil.NoSuchProcess):
-                mem = 0.0
-
+            uptime = now - create_time if create_time else 0
             project = Path(cwd).name if cwd else ""
 
             results.append(ClaudeInstance(
@@ -851,53 +1299,73 @@ def get_claude_instances() -> list[ClaudeInstance]:
                 cpu_percent=cpu,
                 memory_mb=mem,
                 uptime=_format_uptime(uptime),
+                path=cwd,
             ))
         except (psutil.AccessDenied, psutil.NoSuchProcess, psutil.ZombieProcess):
             continue
 
+    _claude_cwds = (time.monotonic(), frozenset(inst.path for inst in results))
     results.sort(key=lambda p: p.memory_mb, reverse=True)
     return results
 
 
-def get_claude_projects() -> list[ClaudeProject]:
-    claude_dir = Path.home() / ".claude"
-    history_file = claude_dir / "history.jsonl"
-    projects_dir = claude_dir / "projects"
+# history.jsonl is append-only, so per-project totals are kept between calls
+# and only lines written since the last read are parsed:
+# (st_ino, offset of the first unread byte, messages, last_active).
+_history_cache: tuple[int, int, dict[str, int], dict[str, float]] | None = None
 
-    # Parse history.jsonl for message counts and last active times per project
-    project_messages: dict[str, int] = {}
-    project_last_active: dict[str, float] = {}
-    if history_file.is_file():
-        try:
-            for line in history_file.read_text(encoding="utf-8").splitlines():
+
+def _scan_history(history_file: Path) -> tuple[dict[str, int], dict[str, float]]:
+    global _history_cache
+    try:
+        st = history_file.stat()
+    except OSError:
+        _history_cache = None
+        return {}, {}
+    cached = _history_cache
+    if cached is not None and cached[0] == st.st_ino and cached[1] <= st.st_size:
+        _, offset, project_messages, project_last_active = cached
+        if offset == st.st_size:
+            return dict(project_messages), dict(project_last_active)
+    else:
+        # New or rewritten file: start over.
+        offset, project_messages, project_last_active = 0, {}, {}
+    try:
+        with history_file.open("rb", buffering=1 << 16) as f:
+            f.seek(offset)
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # partial line still being written; re-read next time
+                offset += len(line)
                 line = line.strip()
                 if not line:
                     continue
                 try:
-                    entry = json.loads(line)
+                    entry = _json_loads(line)
                     proj = entry.get("project", "")
                     ts = entry.get("timestamp", 0)
                     if proj:
                         project_messages[proj] = project_messages.get(proj, 0) + 1
                         if ts > project_last_active.get(proj, 0):
                             project_last_active[proj] = ts
-                except (json.JSONDecodeError, KeyError):
+                except (ValueError, KeyError):
                     continue
-        except OSError:
-            pass
+    except OSError:
+        pass
+    _history_cache = (st.st_ino, offset, project_messages, project_last_active)
+    # Callers get copies so nothing can disturb the running totals.
+    return dict(project_messages), dict(project_last_active)
+
+
+def get_claude_projects() -> list[ClaudeProject]:
+    history_file = _CLAUDE_HISTORY
+    projects_dir = _CLAUDE_PROJECTS
+
+    # Parse history.jsonl for message counts and last active times per project
+    project_messages, project_last_active = _scan_history(history_file)
 
     # Get running instance CWDs for status
-    try:
-        running_instances = get_claude_instances()
-    except Exception:
-        running_instances = []
-    running_cwds: set[str] = set()
-    for inst in running_instances:
-        # Expand ~ back to home for comparison
-        cwd = inst.cwd
-        if cwd.startswith("~"):
-            cwd = str(Path.home()) + cwd[1:]
-        running_cwds.add(cwd)
+    running_cwds = _running_claude_cwds()
 
     # Build project list from history entries
     seen_paths: set[str] = set()
@@ -956,7 +1424,7 @@ class ClaudeStats:
     total_messages: int
     model_usage: dict[str, tuple[int, int, int]]  # model -> (input, output, cache_read)
     daily_activity: list[tuple[str, int]]  # last 14 days: (date, message_count)
-    hour_counts: dict[int, int]  # hour 0-23 -> count
+    hour_counts: tuple[int, ...]  # 24 slots, index = hour 0-23
 
 
 @dataclass
@@ -993,7 +1461,7 @@ def _format_iso_sortable(iso: str) -> str:
 
 
 def get_claude_stats() -> ClaudeStats | None:
-    stats_file = Path.home() / ".claude" / "stats-cache.json"
+    stats_file = _CLAUDE_STATS
     if not stats_file.is_file():
         return None
     try:
@@ -1016,7 +1484,15 @@ def get_claude_stats() -> ClaudeStats | None:
     ]
 
     raw_hours = data.get("hourCounts") or {}
-    hour_counts = {int(k): v for k, v in raw_hours.items()}
+    hours = [0] * 24
+    for k, v in raw_hours.items():
+        try:
+            h = int(k)
+        except ValueError:
+            continue
+        if 0 <= h < 24:
+            hours[h] = v
+    hour_counts = tuple(hours)
 
     return ClaudeStats(
         total_sessions=data.get("totalSessions", 0),
@@ -1029,7 +1505,7 @@ def get_claude_stats() -> ClaudeStats | None:
 
 def get_project_sessions(project_path: str) -> list[ClaudeSessionEntry]:
     encoded = project_path.replace("/", "-")
-    index_file = Path.home() / ".claude" / "projects" / encoded / "sessions-index.json"
+    index_file = _CLAUDE_PROJECTS / encoded / "sessions-index.json"
     if not index_file.is_file():
         return []
     try:
@@ -1047,7 +1523,7 @@ def get_project_sessions(project_path: str) -> list[ClaudeSessionEntry]:
             git_branch=e.get("gitBranch", ""),
             created=_format_iso_datetime(e.get("created", "")),
             modified=_format_iso_datetime(e.get("modified", "")),
-            project_path=e.get("projectPath", project_path),
+            project_path=_expand_home(e.get("projectPath", project_path)),
             is_sidechain=e.get("isSidechain", False),
         ))
 
@@ -1057,7 +1533,7 @@ def get_project_sessions(project_path: str) -> list[ClaudeSessionEntry]:
 
 def get_all_recent_sessions() -> list[ClaudeSessionEntry]:
     """Return the 50 most recent sessions across all projects."""
-    projects_dir = Path.home() / ".claude" / "projects"
+    projects_dir = _CLAUDE_PROJECTS
     if not projects_dir.is_dir():
         return []
 
@@ -1079,7 +1555,7 @@ def get_all_recent_sessions() -> list[ClaudeSessionEntry]:
                 git_branch=e.get("gitBranch", ""),
                 created=_format_iso_sortable(e.get("created", "")),
                 modified=_format_iso_sortable(raw_modified),
-                project_path=e.get("projectPath", ""),
+                project_path=_expand_home(e.get("projectPath", "")),
                 is_sidechain=e.get("isSidechain", False),
             )
             raw_entries.append((raw_modified, entry))
@@ -1092,7 +1568,6 @@ def get_project_detail(project_path: str) -> ClaudeProjectDetail:
     name = Path(project_path).name
 
     # Aggregate session-meta files for this project
-    meta_dir = Path.home() / ".claude" / "usage-data" / "session-meta"
     total_messages = 0
     total_lines_added = 0
     total_lines_removed = 0
@@ -1102,30 +1577,23 @@ def get_project_detail(project_path: str) -> ClaudeProjectDetail:
     languages: dict[str, int] = {}
     session_count = 0
 
-    if meta_dir.is_dir():
-        for meta_file in meta_dir.iterdir():
-            if not meta_file.suffix == ".json":
-                continue
-            try:
-                meta = json.loads(meta_file.read_text(encoding="utf-8"))
-            except (json.JSONDecodeError, OSError):
-                continue
-            if meta.get("project_path") != project_path:
-                continue
-            session_count += 1
-            total_messages += meta.get("user_message_count", 0) + meta.get("assistant_message_count", 0)
-            total_lines_added += meta.get("lines_added", 0)
-            total_lines_removed += meta.get("lines_removed", 0)
-            total_files_modified += meta.get("files_modified", 0)
-            git_commits += meta.get("git_commits", 0)
-            for tool, count in (meta.get("tool_counts") or {}).items():
-                tools_used[tool] = tools_used.get(tool, 0) + count
-            for lang, count in (meta.get("languages") or {}).items():
-                languages[lang] = languages.get(lang, 0) + count
+    for meta in _session_metas():
+        if meta.get("project_path") != project_path:
+            continue
+        session_count += 1
+        total_messages += meta.get("user_message_count", 0) + meta.get("assistant_message_count", 0)
+        total_lines_added += meta.get("lines_added", 0)
+        total_lines_removed += meta.get("lines_removed", 0)
+        total_files_modified += meta.get("files_modified", 0)
+        git_commits += meta.get("git_commits", 0)
+        for tool, count in (meta.get("tool_counts") or {}).items():
+            tools_used[tool] = tools_used.get(tool, 0) + count
+        for lang, count in (meta.get("languages") or {}).items():
+            languages[lang] = languages.get(lang, 0) + count
 
     # Read MEMORY.md
     encoded = project_path.replace("/", "-")
-    memory_file = Path.home() / ".claude" / "projects" / encoded / "memory" / "MEMORY.md"
+    memory_file = _CLAUDE_PROJECTS / encoded / "memory" / "MEMORY.md"
     memory_content = None
     if memory_file.is_file():
         try:
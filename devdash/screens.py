@@ -531,10 +531,16 @@ class ConfirmScreen(ModalScreen[bool]):
         Binding("escape", "cancel", "Cancel", show=False),
     ]
 
-    def __init__(self, message: str) -> None:
+    def __init__(self, message: str = "") -> None:
         super().__init__()
         self._message = message
 
+    def set_message(self, message: str) -> None:
+        """Change the prompt; lets one installed instance be reused across prompts."""
+        self._message = message
+        if self.is_mounted:
+            self.query_one("#confirm-label", Label).update(message)
+
     def compose(self) -> ComposeResult:
         with Vertical(id="confirm-dialog"):
             yield Label(self._message, id="confirm-label")
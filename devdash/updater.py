@@ -3,8 +3,10 @@ from __future__ import annotations
 import json
 import subprocess
 import sys
+import threading
 import time
 import urllib.request
+from dataclasses import dataclass, field
 from pathlib import Path
 
 _DATA_DIR = Path.home() / ".local" / "share" / "devdash"
@@ -13,6 +15,14 @@ _CHECK_INTERVAL = 86400  # 24 hours
 _RELEASES_URL = "https://api.github.com/repos/enso-works/devdash/releases/latest"
 
 
+@dataclass
+class UpdateResult:
+    """Outcome of the background update check, shared between cli and app."""
+
+    message: str | None = None
+    done: threading.Event = field(default_factory=threading.Event)
+
+
 def _get_install_dir() -> Path | None:
     """Return the git repo root above this package, or None if not a git clone."""
     pkg_dir = Path(__file__).resolve().parent